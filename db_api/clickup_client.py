@@ -1,7 +1,8 @@
 import os
-import requests
 from dotenv import load_dotenv
 
+from clickup_http import ClickUpSession
+
 load_dotenv()
 
 class ClickUpClient:
@@ -11,14 +12,12 @@ class ClickUpClient:
         self.api_key = api_key or os.getenv("CLICKUP_API_KEY")
         if not self.api_key:
             raise ValueError("API key is required. Set CLICKUP_API_KEY in .env or pass it directly.")
-        self.headers = {
-            "Authorization": self.api_key,
-            "Content-Type": "application/json"
-        }
+        self.session = ClickUpSession(self.api_key)
+        self.headers = self.session.headers
 
     def _request(self, method: str, endpoint: str, **kwargs) -> dict:
         url = f"{self.BASE_URL}/{endpoint}"
-        response = requests.request(method, url, headers=self.headers, **kwargs)
+        response = self.session.request(method, url, **kwargs)
         response.raise_for_status()
         return response.json()
 
@@ -76,14 +75,14 @@ class ClickUpClient:
     def search_docs(self, workspace_id: str, **params) -> dict:
         """Search docs in a workspace."""
         url = f"https://api.clickup.com/api/v3/workspaces/{workspace_id}/docs"
-        response = requests.get(url, headers=self.headers, params=params)
+        response = self.session.get(url, params=params)
         response.raise_for_status()
         return response.json()
 
     def get_doc(self, workspace_id: str, doc_id: str) -> dict:
         """Get a specific doc."""
         url = f"https://api.clickup.com/api/v3/workspaces/{workspace_id}/docs/{doc_id}"
-        response = requests.get(url, headers=self.headers)
+        response = self.session.get(url)
         response.raise_for_status()
         return response.json()
 
@@ -101,14 +100,14 @@ class ClickUpClient:
         if parent:
             data["parent"] = parent
         url = f"https://api.clickup.com/api/v3/workspaces/{workspace_id}/docs"
-        response = requests.post(url, headers=self.headers, json=data)
+        response = self.session.post(url, json=data)
         response.raise_for_status()
         return response.json()
 
     def get_doc_pages(self, workspace_id: str, doc_id: str) -> dict:
         """Get all pages in a doc."""
         url = f"https://api.clickup.com/api/v3/workspaces/{workspace_id}/docs/{doc_id}/pages"
-        response = requests.get(url, headers=self.headers)
+        response = self.session.get(url)
         response.raise_for_status()
         return response.json()
 
@@ -118,7 +117,7 @@ class ClickUpClient:
         if content:
             data["content"] = content
         url = f"https://api.clickup.com/api/v3/workspaces/{workspace_id}/docs/{doc_id}/pages"
-        response = requests.post(url, headers=self.headers, json=data)
+        response = self.session.post(url, json=data)
         response.raise_for_status()
         return response.json()
 
@@ -131,7 +130,7 @@ class ClickUpClient:
         """
         url = f"https://api.clickup.com/api/v3/workspaces/{workspace_id}/docs/{doc_id}/pages/{page_id}"
         params = {"content_format": content_format}
-        response = requests.get(url, headers=self.headers, params=params)
+        response = self.session.get(url, params=params)
         response.raise_for_status()
         return response.json()
 
@@ -145,7 +144,7 @@ class ClickUpClient:
             content_edit_mode: 'replace', 'append', or 'prepend'
         """
         url = f"https://api.clickup.com/api/v3/workspaces/{workspace_id}/docs/{doc_id}/pages/{page_id}"
-        response = requests.put(url, headers=self.headers, json=kwargs)
+        response = self.session.put(url, json=kwargs)
         response.raise_for_status()
         return response.json()
 
@@ -0,0 +1,130 @@
+"""
+Shared, rate-limit-aware HTTP session for the ClickUp API.
+
+ClickUp limits requests per token per minute and reports the budget in
+X-RateLimit-Limit / X-RateLimit-Remaining / X-RateLimit-Reset. This session:
+- paces requests with a token bucket that is resynced from those headers,
+- waits for the reset time (or Retry-After) and retries on 429,
+- retries timeouts, connection errors and 5xx with exponential backoff for
+  idempotent methods only (a POST whose response was lost may already have
+  created the task/doc/webhook; it is retried only if it never connected),
+- reuses pooled keep-alive connections, safely shared between threads.
+
+Usage:
+    from clickup_http import ClickUpSession
+
+    session = ClickUpSession(api_key, pool_size=8)
+    response = session.get("https://api.clickup.com/api/v2/user")
+"""
+
+import os
+import time
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Default budget until the first response tells us the real limit
+DEFAULT_RATE_PER_MINUTE = int(os.getenv("CLICKUP_RATE_LIMIT", "100"))
+MAX_RETRIES = 5
+BACKOFF_BASE_SECONDS = 1.0
+REQUEST_TIMEOUT = 60
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+
+class RateLimiter:
+    """Thread-safe token bucket driven by ClickUp's rate-limit headers."""
+
+    def __init__(self, rate_per_minute=DEFAULT_RATE_PER_MINUTE):
+        self.capacity = rate_per_minute
+        self.tokens = float(rate_per_minute)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0  # wall-clock time, from X-RateLimit-Reset
+        self.lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.capacity / 60)
+        self.updated = now
+
+    def acquire(self):
+        """Block until a request may be sent."""
+        while True:
+            with self.lock:
+                wait = self.blocked_until - time.time()
+                if wait <= 0:
+                    self._refill()
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    wait = (1 - self.tokens) * 60 / self.capacity
+            time.sleep(wait)
+
+    def update(self, headers):
+        """Resync the bucket from a response's rate-limit headers."""
+        limit = headers.get("X-RateLimit-Limit")
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        with self.lock:
+            self._refill()
+            if limit:
+                self.capacity = max(int(limit), 1)
+            if remaining is not None:
+                # The server's count is authoritative; never assume more than it reports
+                self.tokens = min(self.tokens, float(remaining))
+                if int(remaining) <= 0 and reset:
+                    self.blocked_until = max(self.blocked_until, float(reset))
+
+    def block_for(self, seconds):
+        """Pause all requests for the given number of seconds."""
+        with self.lock:
+            self.blocked_until = max(self.blocked_until, time.time() + seconds)
+
+
+class ClickUpSession(requests.Session):
+    """requests.Session with ClickUp auth, rate limiting and retries."""
+
+    def __init__(self, api_key, pool_size=10, rate_per_minute=DEFAULT_RATE_PER_MINUTE):
+        super().__init__()
+        self.headers.update({
+            "Authorization": api_key,
+            "Content-Type": "application/json"
+        })
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.mount("https://", adapter)
+        self.limiter = RateLimiter(rate_per_minute)
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", REQUEST_TIMEOUT)
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        for attempt in range(MAX_RETRIES + 1):
+            backoff = BACKOFF_BASE_SECONDS * 2 ** attempt
+            self.limiter.acquire()
+            try:
+                response = super().request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == MAX_RETRIES or not (idempotent or isinstance(e, requests.ConnectTimeout)):
+                    raise
+                time.sleep(backoff)
+                continue
+
+            self.limiter.update(response.headers)
+            if attempt == MAX_RETRIES:
+                return response
+
+            if response.status_code == 429:
+                retry_after = response.headers.get("Retry-After", "")
+                reset = response.headers.get("X-RateLimit-Reset")
+                if retry_after.isdigit():
+                    self.limiter.block_for(float(retry_after))
+                elif reset:
+                    self.limiter.block_for(max(float(reset) - time.time(), 0) + 1)
+                else:
+                    self.limiter.block_for(backoff)
+                continue
+
+            if response.status_code >= 500 and idempotent:
+                time.sleep(backoff)
+                continue
+
+            return response
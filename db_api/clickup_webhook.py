@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+ClickUp webhook receiver for push-based order sync.
+
+Receives taskCreated / taskUpdated / taskCommentPosted / taskDeleted events
+for the Orders list, queues the affected task IDs and applies them to
+clickup_orders, clickup_order_comments and clickup_order_attachments in
+micro-batches. An incremental pull (sync_orders) runs periodically as a
+safety net for missed deliveries.
+
+Usage:
+    python3 db_api/clickup_webhook.py                              # Listen on :8787
+    python3 db_api/clickup_webhook.py --port 9000 --batch-seconds 10
+    python3 db_api/clickup_webhook.py --register https://host/clickup  # Create the webhook in ClickUp
+
+Requires CLICKUP_WEBHOOK_SECRET (returned by --register) in .env to verify X-Signature.
+"""
+
+import os
+import sys
+import hmac
+import json
+import time
+import hashlib
+import argparse
+import threading
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+import sync_clickup
+from sync_clickup import (
+    BASE_URL, ORDERS_LIST_ID, SESSION, MAX_WORKERS,
+    ensure_tables, fetch_task_details, sync_orders,
+    order_row, comment_row, attachment_row, upsert_rows,
+)
+
+WEBHOOK_SECRET = os.getenv("CLICKUP_WEBHOOK_SECRET")
+WEBHOOK_EVENTS = ["taskCreated", "taskUpdated", "taskCommentPosted", "taskDeleted"]
+
+# A task that fails this many batches in a row is dropped (the reconcile pull picks it up)
+MAX_TASK_ATTEMPTS = 5
+
+
+def log(msg):
+    """Print with timestamp."""
+    print(f"[{datetime.now().strftime('%H:%M:%S')}] {msg}", flush=True)
+
+
+def verify_signature(body, signature, secret=None):
+    """Check ClickUp's X-Signature (hex HMAC-SHA256 of the raw body)."""
+    secret = secret or WEBHOOK_SECRET
+    if not secret:
+        return False
+    expected = hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature or "")
+
+
+class EventQueue:
+    """Thread-safe, de-duplicating queue of task IDs to refresh or delete."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.updated = set()
+        self.deleted = set()
+        self.attempts = {}  # task_id -> failed batches in a row
+        self.received = 0
+
+    def put(self, event):
+        task_id = event.get("task_id")
+        if not task_id:
+            return
+        with self.lock:
+            self.received += 1
+            if event.get("event") == "taskDeleted":
+                self.updated.discard(task_id)
+                self.deleted.add(task_id)
+            else:
+                self.deleted.discard(task_id)
+                self.updated.add(task_id)
+
+    def drain(self):
+        with self.lock:
+            updated, deleted = self.updated, self.deleted
+            self.updated, self.deleted = set(), set()
+        return updated, deleted
+
+    def done(self, task_ids):
+        """Forget failure counts of applied tasks."""
+        with self.lock:
+            for task_id in task_ids:
+                self.attempts.pop(task_id, None)
+
+    def retry(self, updated, deleted):
+        """Re-queue failed task IDs; returns those dropped after MAX_TASK_ATTEMPTS."""
+        dropped = []
+        with self.lock:
+            for task_id, target in [(t, self.updated) for t in updated] + [(t, self.deleted) for t in deleted]:
+                self.attempts[task_id] = self.attempts.get(task_id, 0) + 1
+                if self.attempts[task_id] >= MAX_TASK_ATTEMPTS:
+                    del self.attempts[task_id]
+                    dropped.append(task_id)
+                elif task_id not in self.updated and task_id not in self.deleted:
+                    target.add(task_id)  # a newer event for the task takes precedence
+        return dropped
+
+
+def fetch_task(task_id):
+    """Fetch a full task (includes attachments); None if gone."""
+    response = SESSION.get(f"{BASE_URL}/task/{task_id}")
+    if response.status_code == 404:
+        return None
+    response.raise_for_status()
+    return response.json()
+
+
+def fetch_order(task_id):
+    """(task, comments, attachments) for an order task; None if deleted or moved out of Orders."""
+    task = fetch_task(task_id)
+    if task is None or task.get("list", {}).get("id") != ORDERS_LIST_ID:
+        return None
+    comments, attachments = fetch_task_details(task)
+    return task, comments, attachments
+
+
+def apply_batch(updated, deleted):
+    """
+    Refresh updated tasks and remove deleted ones.
+
+    Returns:
+        task IDs whose fetch failed (not applied; the caller retries them)
+    """
+    now = datetime.now()
+    deleted = set(deleted)
+    failed = set()
+    orders, comments, attachments = [], {}, {}
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        futures = {pool.submit(fetch_order, task_id): task_id for task_id in updated}
+        for future, task_id in futures.items():
+            try:
+                result = future.result()
+            except Exception as e:
+                log(f"ERROR fetching task {task_id}: {e}")
+                failed.add(task_id)
+                continue
+            if result is None:
+                deleted.add(task_id)  # gone or moved out of the Orders list
+                continue
+            task, task_comments, task_attachments = result
+            orders.append(order_row(task, task_attachments, now))
+            for comment in task_comments:
+                comments[comment["id"]] = comment_row(comment, task_id, now)
+            for att in task_attachments:
+                attachments[att["id"]] = attachment_row(att, task_id, now)
+
+    if orders or deleted:
+        # Hold the warehouse lock only while writing, so other syncs can run between batches
+        conn = sync_clickup.get_connection()
+        try:
+            apply_changes(conn, orders, list(comments.values()), list(attachments.values()), deleted)
+        finally:
+            conn.close()
+
+    log(f"Applied {len(orders)} updated, {len(deleted)} deleted tasks"
+        + (f", {len(failed)} failed" if failed else ""))
+    return failed
+
+
+def apply_changes(conn, orders, comments, attachments, deleted):
+    """Remove deleted tasks and upsert fetched rows in one transaction."""
+    conn.execute("BEGIN TRANSACTION")
+    try:
+        if deleted:
+            ids = list(deleted)
+            placeholders = ", ".join(["?"] * len(ids))
+            for table in ("clickup_order_comments", "clickup_order_attachments", "clickup_orders"):
+                conn.execute(f"DELETE FROM {table} WHERE task_id IN ({placeholders})", ids)
+        upsert_rows(conn, orders, comments, attachments)
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+
+def retry_later(queue, updated, deleted):
+    for task_id in queue.retry(updated, deleted):
+        log(f"Giving up on task {task_id} after {MAX_TASK_ATTEMPTS} attempts (left to reconcile)")
+
+
+def run_worker(queue, stop, batch_seconds, reconcile_seconds):
+    """
+    Apply queued events every batch_seconds; pull-reconcile every reconcile_seconds.
+
+    Each batch and reconcile opens its own connection and closes it when done:
+    a read-write DuckDB connection locks warehouse.duckdb for every other process.
+    """
+    conn = sync_clickup.get_connection()
+    try:
+        ensure_tables(conn)
+    finally:
+        conn.close()
+
+    last_reconcile = time.time()
+    while not stop.wait(batch_seconds):
+        updated, deleted = queue.drain()
+        if updated or deleted:
+            try:
+                failed = apply_batch(updated, deleted)
+            except Exception as e:
+                log(f"ERROR applying batch: {e} (re-queued)")
+                retry_later(queue, updated, deleted)
+            else:
+                queue.done((updated | deleted) - failed)
+                retry_later(queue, failed, set())
+
+        if time.time() - last_reconcile >= reconcile_seconds:
+            log("Reconciling with incremental pull...")
+            try:
+                conn = sync_clickup.get_connection()
+                try:
+                    new_count, updated_count, _ = sync_orders(conn)
+                finally:
+                    conn.close()
+                log(f"  Reconciled: {new_count} new, {updated_count} updated")
+            except Exception as e:
+                log(f"ERROR reconciling: {e}")
+            last_reconcile = time.time()
+
+
+def make_handler(queue):
+    class WebhookHandler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            if not verify_signature(body, self.headers.get("X-Signature")):
+                self.send_response(401)
+                self.end_headers()
+                return
+            try:
+                event = json.loads(body)
+            except ValueError:
+                self.send_response(400)
+                self.end_headers()
+                return
+
+            if event.get("event") in WEBHOOK_EVENTS:
+                queue.put(event)
+            self.send_response(200)
+            self.end_headers()
+
+        def log_message(self, format, *args):
+            pass  # Quiet; batches are logged by the worker
+
+    return WebhookHandler
+
+
+def register_webhook(endpoint):
+    """Create a ClickUp webhook for the Orders list pointing at endpoint."""
+    teams = SESSION.get(f"{BASE_URL}/team")
+    teams.raise_for_status()
+    team_id = teams.json()["teams"][0]["id"]
+
+    response = SESSION.post(f"{BASE_URL}/team/{team_id}/webhook", json={
+        "endpoint": endpoint,
+        "events": WEBHOOK_EVENTS,
+        "list_id": int(ORDERS_LIST_ID),
+    })
+    response.raise_for_status()
+    webhook = response.json().get("webhook", {})
+    print(f"Webhook created: {webhook.get('id')}")
+    print(f"Set CLICKUP_WEBHOOK_SECRET={webhook.get('secret')} in .env")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ClickUp webhook receiver for order sync")
+    parser.add_argument("--port", type=int, default=8787, help="Port to listen on (default: 8787)")
+    parser.add_argument("--batch-seconds", type=float, default=5, help="Micro-batch interval (default: 5)")
+    parser.add_argument("--reconcile-minutes", type=float, default=60,
+                        help="Incremental pull interval (default: 60)")
+    parser.add_argument("--register", metavar="URL", help="Register the webhook in ClickUp and exit")
+    args = parser.parse_args()
+
+    if args.register:
+        register_webhook(args.register)
+        return
+
+    if not WEBHOOK_SECRET:
+        print("ERROR: CLICKUP_WEBHOOK_SECRET is not set (run with --register first)")
+        sys.exit(1)
+
+    queue = EventQueue()
+    stop = threading.Event()
+    worker = threading.Thread(
+        target=run_worker,
+        args=(queue, stop, args.batch_seconds, args.reconcile_minutes * 60),
+        daemon=True
+    )
+    worker.start()
+
+    server = ThreadingHTTPServer(("", args.port), make_handler(queue))
+    log(f"Listening on :{args.port} (batch every {args.batch_seconds}s)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        stop.set()
+        worker.join()
+        log(f"Stopped after {queue.received} events")
+
+
+if __name__ == "__main__":
+    main()
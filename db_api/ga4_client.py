@@ -10,6 +10,9 @@ Usage:
     python3 db_api/ga4_client.py pages              # Top pages last 7 days
     python3 db_api/ga4_client.py sources            # Traffic sources last 7 days
     python3 db_api/ga4_client.py countries          # Top countries last 7 days
+    python3 db_api/ga4_client.py cache              # Show report cache stats
+    python3 db_api/ga4_client.py cache-clear        # Empty the report cache
+    python3 db_api/ga4_client.py pages --no-cache   # Bypass the report cache
 """
 
 import os
@@ -20,47 +23,55 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
-# Check for required package
-try:
-    from google.analytics.data_v1beta import BetaAnalyticsDataClient
-    from google.analytics.data_v1beta.types import (
-        RunReportRequest,
-        RunRealtimeReportRequest,
-        DateRange,
-        Dimension,
-        Metric,
-    )
-    from google.oauth2 import service_account
-except ImportError:
-    print("Required packages not installed. Run:")
-    print("  pip3 install google-analytics-data google-auth")
-    sys.exit(1)
+from google_bootstrap import GOOGLE_SERVICE_ACCOUNT_FILE, require, ga4_data_client
+
+# Check for required packages (imported lazily, only when the API is used)
+require('google.analytics.data_v1beta', 'google.oauth2', 'numpy',
+        install='google-analytics-data google-auth numpy')
+
+from ga4_columns import response_to_columns
+from report_cache import ReportCache, GA4_FINALITY_DAYS, make_key, resolve_date, ttl_for
+from warehouse_planner import ga4_pages_exact
 
 # Configuration
 GA4_PROPERTY_ID = os.getenv('GA4_PROPERTY_ID', '480666040')
-GOOGLE_SERVICE_ACCOUNT_FILE = os.getenv(
-    'GOOGLE_SERVICE_ACCOUNT_FILE',
-    os.path.join(os.path.dirname(__file__), 'getlinkspro-453615-c0e5ea39671a.json')
-)
 
 
 class GA4Client:
-    def __init__(self, property_id=None, credentials_file=None):
+    def __init__(self, property_id=None, credentials_file=None, use_cache=True, use_warehouse=True):
         self.property_id = property_id or GA4_PROPERTY_ID
         self.credentials_file = credentials_file or GOOGLE_SERVICE_ACCOUNT_FILE
+        self.cache = ReportCache() if use_cache else None
+        # sync_ga4 only stores the default property
+        self.use_warehouse = use_warehouse and self.property_id == GA4_PROPERTY_ID
 
         if not os.path.exists(self.credentials_file):
             raise FileNotFoundError(f"Service account file not found: {self.credentials_file}")
 
-        credentials = service_account.Credentials.from_service_account_file(
-            self.credentials_file,
-            scopes=['https://www.googleapis.com/auth/analytics.readonly']
-        )
-        self.client = BetaAnalyticsDataClient(credentials=credentials)
         self.property = f"properties/{self.property_id}"
 
+    @property
+    def client(self):
+        """Shared BetaAnalyticsDataClient, built on first API call"""
+        return ga4_data_client(self.credentials_file)
+
     def run_report(self, dimensions, metrics, start_date='7daysAgo', end_date='today', limit=10):
         """Run a GA4 report with specified dimensions and metrics"""
+        from google.analytics.data_v1beta.types import (
+            RunReportRequest, RunReportResponse, DateRange, Dimension, Metric
+        )
+
+        # Relative dates are resolved so cache keys pin the actual range
+        start_date = resolve_date(start_date)
+        end_date = resolve_date(end_date)
+
+        key = None
+        if self.cache:
+            key = make_key('ga4', self.property_id, dimensions, metrics, start_date, end_date, limit)
+            blob = self.cache.get(key)
+            if blob is not None:
+                return RunReportResponse.deserialize(blob)
+
         request = RunReportRequest(
             property=self.property,
             dimensions=[Dimension(name=d) for d in dimensions],
@@ -68,10 +79,16 @@ class GA4Client:
             date_ranges=[DateRange(start_date=start_date, end_date=end_date)],
             limit=limit
         )
-        return self.client.run_report(request)
+        response = self.client.run_report(request)
+
+        if self.cache:
+            self.cache.set(key, RunReportResponse.serialize(response), ttl_for(end_date, GA4_FINALITY_DAYS))
+        return response
 
     def get_realtime(self):
         """Get realtime active users"""
+        from google.analytics.data_v1beta.types import RunRealtimeReportRequest, Dimension, Metric
+
         request = RunRealtimeReportRequest(
             property=self.property,
             dimensions=[Dimension(name='country')],
@@ -90,7 +107,19 @@ class GA4Client:
         )
 
     def get_top_pages(self, start_date='7daysAgo', end_date='today', limit=20):
-        """Get top pages by pageviews"""
+        """Get top pages by pageviews (from the warehouse when sync_ga4 stored this exact range)"""
+        if self.use_warehouse:
+            rows = ga4_pages_exact(resolve_date(start_date), resolve_date(end_date), limit)
+            # Users can't be recovered for paths stored under several titles; ask the API then
+            if rows is not None and all(row[2] is not None for row in rows):
+                from google.analytics.data_v1beta.types import MetricType
+                return build_response(
+                    ['pagePath'],
+                    [('screenPageViews', MetricType.TYPE_INTEGER),
+                     ('totalUsers', MetricType.TYPE_INTEGER),
+                     ('averageSessionDuration', MetricType.TYPE_SECONDS)],
+                    rows
+                )
         return self.run_report(
             dimensions=['pagePath'],
             metrics=['screenPageViews', 'totalUsers', 'averageSessionDuration'],
@@ -130,6 +159,34 @@ class GA4Client:
         )
 
 
+def build_response(dimensions, metrics, rows):
+    """
+    Build a RunReportResponse from local rows so callers can't tell it apart from the API.
+
+    Args:
+        dimensions: Dimension names
+        metrics: List of (metric name, MetricType)
+        rows: Tuples of dimension values followed by metric values
+    """
+    from google.analytics.data_v1beta.types import (
+        RunReportResponse, DimensionHeader, DimensionValue, MetricHeader, MetricValue, Row
+    )
+
+    n_dims = len(dimensions)
+    return RunReportResponse(
+        dimension_headers=[DimensionHeader(name=d) for d in dimensions],
+        metric_headers=[MetricHeader(name=m, type_=t) for m, t in metrics],
+        rows=[
+            Row(
+                dimension_values=[DimensionValue(value=str(v)) for v in row[:n_dims]],
+                metric_values=[MetricValue(value=str(v if v is not None else 0)) for v in row[n_dims:]],
+            )
+            for row in rows
+        ],
+        row_count=len(rows),
+    )
+
+
 def print_report(response, title):
     """Pretty print a GA4 report response"""
     print(f"\n{title}")
@@ -139,34 +196,40 @@ def print_report(response, title):
         print("No data")
         return
 
-    # Get headers
-    dim_headers = [h.name for h in response.dimension_headers]
-    metric_headers = [h.name for h in response.metric_headers]
+    columns = response_to_columns(response)
 
     # Print header
-    header = dim_headers + metric_headers
-    print(" | ".join(f"{h:<20}" for h in header))
+    print(" | ".join(f"{h:<20}" for h in columns))
     print("-" * 60)
 
     # Print rows
-    for row in response.rows:
-        dims = [d.value for d in row.dimension_values]
-        metrics = [m.value for m in row.metric_values]
-        values = dims + metrics
-        print(" | ".join(f"{v:<20}" for v in values))
+    for values in zip(*columns.values()):
+        print(" | ".join(f"{str(v):<20}" for v in values))
 
 
 def main():
+    args = [a for a in sys.argv[1:] if a != '--no-cache']
+    use_cache = '--no-cache' not in sys.argv
+    cmd = args[0] if args else 'overview'
+
+    # Cache maintenance is local; it doesn't need credentials or a client
+    if cmd in ('cache', 'cache-clear'):
+        cache = ReportCache()
+        if cmd == 'cache-clear':
+            cache.clear()
+            print("Report cache cleared")
+        stats = cache.stats()
+        print(f"Report cache: {stats['entries']} entries, {stats['size_bytes'] / 1024:.1f}KB ({cache.path})")
+        return
+
     try:
-        client = GA4Client()
+        client = GA4Client(use_cache=use_cache)
         print(f"GA4 Property: {client.property_id}")
         print(f"Credentials: {os.path.basename(client.credentials_file)}")
     except Exception as e:
         print(f"Failed to initialize GA4 client: {e}")
         sys.exit(1)
 
-    cmd = sys.argv[1] if len(sys.argv) > 1 else 'overview'
-
     try:
         if cmd == 'realtime':
             response = client.get_realtime()
@@ -188,6 +251,9 @@ def main():
             print_report(response, "Traffic Overview (Last 7 Days)")
 
         print("\nGA4 connection successful!")
+        if client.cache:
+            stats = client.cache.stats()
+            print(f"Cache: {stats['hits']} hits, {stats['misses']} misses")
 
     except Exception as e:
         print(f"Error running report: {e}")
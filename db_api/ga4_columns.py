@@ -0,0 +1,50 @@
+"""
+Columnar decoding of GA4 Data API responses.
+
+Turns a RunReportResponse / RunRealtimeReportResponse into one typed NumPy
+array per dimension/metric instead of a dict per row. Metric types come from
+`metric_headers[].type`, so each column is converted once (vectorized) rather
+than guessing int/float value by value.
+
+Usage:
+    from ga4_columns import response_to_columns, response_to_frame
+
+    columns = response_to_columns(response)   # {'date': array([...]), 'sessions': array([...])}
+    df = response_to_frame(response)          # pandas DataFrame, ready for "SELECT ... FROM df"
+"""
+
+import numpy as np
+
+# Metric types that GA4 reports as whole numbers (MetricType.TYPE_INTEGER);
+# everything else (float, seconds, currency, distances, ...) is decoded as float64.
+# Kept as raw enum values so this module doesn't import the GA4 client library.
+INTEGER_METRIC_TYPES = {1}
+
+
+def _raw(response):
+    """Return the underlying protobuf message (skips proto-plus wrappers)."""
+    return type(response).pb(response)
+
+
+def response_to_columns(response):
+    """Decode a GA4 response into an ordered dict of column name -> NumPy array."""
+    pb = _raw(response)
+    rows = pb.rows
+    columns = {}
+
+    for i, header in enumerate(pb.dimension_headers):
+        columns[header.name] = np.array([r.dimension_values[i].value for r in rows], dtype=object)
+
+    for i, header in enumerate(pb.metric_headers):
+        dtype = np.int64 if header.type in INTEGER_METRIC_TYPES else np.float64
+        values = [r.metric_values[i].value for r in rows]
+        columns[header.name] = np.array(values, dtype=str).astype(dtype) if values else np.empty(0, dtype)
+
+    return columns
+
+
+def response_to_frame(response):
+    """Decode a GA4 response into a pandas DataFrame (one column per header)."""
+    import pandas as pd
+
+    return pd.DataFrame(response_to_columns(response))
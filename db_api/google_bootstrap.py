@@ -0,0 +1,140 @@
+"""
+Shared, lazy bootstrap for Google API clients (GA4, Search Console, BigQuery).
+
+- The service-account JSON is read once per process; each client gets
+  credentials scoped to just the API it calls (GA4 and Search Console are
+  read-only, only BigQuery gets the bigquery scope).
+- Clients are built on first use and reused; heavy Google libraries are only
+  imported at that point.
+- The Search Console discovery document is cached on disk, so building the
+  service never fetches or re-resolves it.
+
+Usage:
+    from google_bootstrap import require, ga4_data_client, searchconsole_service, bigquery_client
+
+    require('google.analytics.data_v1beta', install='google-analytics-data google-auth')
+    client = ga4_data_client()
+"""
+
+import os
+import sys
+import json
+import threading
+import importlib.util
+
+GOOGLE_SERVICE_ACCOUNT_FILE = os.getenv(
+    'GOOGLE_SERVICE_ACCOUNT_FILE',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'getlinkspro-453615-c0e5ea39671a.json')
+)
+DISCOVERY_CACHE_DIR = os.getenv(
+    'GOOGLE_DISCOVERY_CACHE_DIR',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.cache', 'discovery')
+)
+
+GA4_SCOPES = ['https://www.googleapis.com/auth/analytics.readonly']
+SEARCH_CONSOLE_SCOPES = ['https://www.googleapis.com/auth/webmasters.readonly']
+BIGQUERY_SCOPES = ['https://www.googleapis.com/auth/bigquery']
+
+_lock = threading.Lock()
+_credentials = {}
+_clients = {}
+
+
+def require(*modules, install):
+    """Exit with an install hint if any module is missing (without importing it)."""
+    for module in modules:
+        try:
+            found = importlib.util.find_spec(module) is not None
+        except ModuleNotFoundError:
+            found = False
+        if not found:
+            print("ERROR: Required packages not installed. Run:")
+            print(f"  pip3 install {install}")
+            sys.exit(1)
+
+
+def credentials_path(credentials_file=None):
+    """Absolute path of the service-account file (the key for every cache here)."""
+    return os.path.abspath(credentials_file or GOOGLE_SERVICE_ACCOUNT_FILE)
+
+
+def get_credentials(scopes, credentials_file=None):
+    """Return service-account credentials for credentials_file limited to scopes."""
+    path = credentials_path(credentials_file)
+    with _lock:
+        if path not in _credentials:
+            if not os.path.exists(path):
+                raise FileNotFoundError(f"Service account file not found: {path}")
+
+            from google.oauth2 import service_account
+
+            with open(path) as f:
+                info = json.load(f)
+            _credentials[path] = service_account.Credentials.from_service_account_info(info)
+        return _credentials[path].with_scopes(scopes)
+
+
+def _cached_client(key, factory):
+    """Build a client once per key and reuse it."""
+    with _lock:
+        if key in _clients:
+            return _clients[key]
+    client = factory()
+    with _lock:
+        return _clients.setdefault(key, client)
+
+
+def ga4_data_client(credentials_file=None):
+    """GA4 Data API client (BetaAnalyticsDataClient)."""
+    def factory():
+        from google.analytics.data_v1beta import BetaAnalyticsDataClient
+        return BetaAnalyticsDataClient(credentials=get_credentials(GA4_SCOPES, credentials_file))
+
+    return _cached_client(('ga4', credentials_path(credentials_file)), factory)
+
+
+def bigquery_client(project, credentials_file=None):
+    """BigQuery client for project."""
+    def factory():
+        from google.cloud import bigquery
+        return bigquery.Client(credentials=get_credentials(BIGQUERY_SCOPES, credentials_file), project=project)
+
+    return _cached_client(('bigquery', project, credentials_path(credentials_file)), factory)
+
+
+def discovery_document(name, version):
+    """Return a discovery document, cached on disk after the first lookup."""
+    path = os.path.join(DISCOVERY_CACHE_DIR, f"{name}.{version}.json")
+    if os.path.exists(path):
+        with open(path) as f:
+            return f.read()
+
+    doc = None
+    try:
+        # google-api-python-client >= 2.0 ships static documents
+        from googleapiclient.discovery_cache import get_static_doc
+        doc = get_static_doc(name, version)
+    except ImportError:
+        pass
+    if doc is None:
+        import requests
+        response = requests.get(f"https://{name}.googleapis.com/$discovery/rest", params={'version': version})
+        response.raise_for_status()
+        doc = response.text
+
+    os.makedirs(DISCOVERY_CACHE_DIR, exist_ok=True)
+    with open(path, 'w') as f:
+        f.write(doc)
+    return doc
+
+
+def searchconsole_service(credentials_file=None):
+    """Search Console API service built from the cached discovery document."""
+    def factory():
+        from googleapiclient.discovery import build_from_document
+        return build_from_document(
+            discovery_document('searchconsole', 'v1'),
+            credentials=get_credentials(SEARCH_CONSOLE_SCOPES, credentials_file)
+        )
+
+    return _cached_client(('searchconsole', credentials_path(credentials_file)), factory)
@@ -11,46 +11,47 @@ Usage:
     python3 db_api/gsc_client.py countries               # Performance by country
     python3 db_api/gsc_client.py devices                 # Performance by device
     python3 db_api/gsc_client.py "query filter"          # Search for specific query
+    python3 db_api/gsc_client.py cache                   # Show report cache stats
+    python3 db_api/gsc_client.py cache-clear             # Empty the report cache
+    python3 db_api/gsc_client.py queries --no-cache      # Bypass the report cache
 """
 
 import os
 import sys
+import json
 from datetime import datetime, timedelta
 
 from dotenv import load_dotenv
 
 load_dotenv()
 
-# Check for required package
-try:
-    from google.oauth2 import service_account
-    from googleapiclient.discovery import build
-except ImportError:
-    print("Required packages not installed. Run:")
-    print("  pip3 install google-api-python-client google-auth")
-    sys.exit(1)
+from google_bootstrap import GOOGLE_SERVICE_ACCOUNT_FILE, require, searchconsole_service
+
+# Check for required packages (imported lazily, only when the API is used)
+require('googleapiclient', 'google.oauth2', install='google-api-python-client google-auth')
+
+from report_cache import ReportCache, GSC_FINALITY_DAYS, make_key, ttl_for
+from warehouse_planner import daily_ranges, plan_ranges, gsc_query_totals
 
 # Configuration
 GSC_SITE_URL = os.getenv('GSC_SITE_URL', 'https://fatgrid.com/')
-GOOGLE_SERVICE_ACCOUNT_FILE = os.getenv(
-    'GOOGLE_SERVICE_ACCOUNT_FILE',
-    os.path.join(os.path.dirname(__file__), 'getlinkspro-453615-c0e5ea39671a.json')
-)
 
 
 class GSCClient:
-    def __init__(self, site_url=None, credentials_file=None):
+    def __init__(self, site_url=None, credentials_file=None, use_cache=True, use_warehouse=True):
         self.site_url = site_url or GSC_SITE_URL
         self.credentials_file = credentials_file or GOOGLE_SERVICE_ACCOUNT_FILE
+        self.cache = ReportCache() if use_cache else None
+        # sync_gsc only stores the default site
+        self.use_warehouse = use_warehouse and self.site_url == GSC_SITE_URL
 
         if not os.path.exists(self.credentials_file):
             raise FileNotFoundError(f"Service account file not found: {self.credentials_file}")
 
-        credentials = service_account.Credentials.from_service_account_file(
-            self.credentials_file,
-            scopes=['https://www.googleapis.com/auth/webmasters.readonly']
-        )
-        self.service = build('searchconsole', 'v1', credentials=credentials)
+    @property
+    def service(self):
+        """Shared Search Console service, built on first API call"""
+        return searchconsole_service(self.credentials_file)
 
     def query(self, start_date=None, end_date=None, dimensions=None, filters=None, row_limit=25):
         """
@@ -79,11 +80,20 @@ class GSCClient:
         if filters:
             request['dimensionFilterGroups'] = [{'filters': filters}]
 
+        key = None
+        if self.cache:
+            key = make_key('gsc', self.site_url, request)
+            blob = self.cache.get(key)
+            if blob is not None:
+                return json.loads(blob)
+
         response = self.service.searchanalytics().query(
             siteUrl=self.site_url,
             body=request
         ).execute()
 
+        if self.cache:
+            self.cache.set(key, json.dumps(response).encode('utf-8'), ttl_for(end_date, GSC_FINALITY_DAYS))
         return response
 
     def get_summary(self, days=7):
@@ -93,11 +103,47 @@ class GSCClient:
         return self.query(start_date, end_date, dimensions=['date'])
 
     def get_top_queries(self, days=7, limit=25):
-        """Get top search queries"""
+        """Get top search queries (from the warehouse where sync_gsc already covers the range)"""
         start_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
         end_date = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
+        if self.use_warehouse:
+            response = self._top_queries_from_warehouse(start_date, end_date, limit)
+            if response is not None:
+                return response
         return self.query(start_date, end_date, dimensions=['query'], row_limit=limit)
 
+    def _top_queries_from_warehouse(self, start_date, end_date, limit):
+        """
+        Combine synced gsc_queries_daily dates with API fetches for the uncovered gaps.
+
+        Returns None when the warehouse covers none of the range.
+        """
+        local, missing = plan_ranges(daily_ranges('gsc_queries_daily'), start_date, end_date)
+        if not local:
+            return None
+
+        totals = gsc_query_totals(local)
+        for start, end in missing:
+            response = self.query(start.isoformat(), end.isoformat(), dimensions=['query'], row_limit=25000)
+            for row in response.get('rows', []):
+                t = totals.setdefault(row['keys'][0], [0, 0, 0.0])
+                t[0] += row.get('clicks', 0)
+                t[1] += row.get('impressions', 0)
+                t[2] += row.get('position', 0) * row.get('impressions', 0)
+
+        ranked = sorted(totals.items(), key=lambda kv: (kv[1][0], kv[1][1]), reverse=True)[:limit]
+        rows = [
+            {
+                'keys': [query],
+                'clicks': clicks,
+                'impressions': impressions,
+                'ctr': clicks / impressions if impressions else 0,
+                'position': weighted / impressions if impressions else 0,
+            }
+            for query, (clicks, impressions, weighted) in ranked
+        ]
+        return {'rows': rows, 'source': 'warehouse' if not missing else 'warehouse+api'}
+
     def get_top_pages(self, days=7, limit=25):
         """Get top pages"""
         start_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
@@ -161,16 +207,28 @@ def print_report(response, title, dimensions=None):
 
 
 def main():
+    args = [a for a in sys.argv[1:] if a != '--no-cache']
+    use_cache = '--no-cache' not in sys.argv
+    cmd = args[0] if args else 'summary'
+
+    # Cache maintenance is local; it doesn't need credentials or a client
+    if cmd in ('cache', 'cache-clear'):
+        cache = ReportCache()
+        if cmd == 'cache-clear':
+            cache.clear()
+            print("Report cache cleared")
+        stats = cache.stats()
+        print(f"Report cache: {stats['entries']} entries, {stats['size_bytes'] / 1024:.1f}KB ({cache.path})")
+        return
+
     try:
-        client = GSCClient()
+        client = GSCClient(use_cache=use_cache)
         print(f"Search Console Site: {client.site_url}")
         print(f"Credentials: {os.path.basename(client.credentials_file)}")
     except Exception as e:
         print(f"Failed to initialize GSC client: {e}")
         sys.exit(1)
 
-    cmd = sys.argv[1] if len(sys.argv) > 1 else 'summary'
-
     try:
         if cmd == 'sites':
             sites = client.list_sites()
@@ -198,6 +256,9 @@ def main():
             print_report(response, f"Queries containing '{cmd}' (Last 7 Days)", ['Query'])
 
         print("\nGSC connection successful!")
+        if client.cache:
+            stats = client.cache.stats()
+            print(f"Cache: {stats['hits']} hits, {stats['misses']} misses")
 
     except Exception as e:
         print(f"Error: {e}")
@@ -0,0 +1,170 @@
+"""
+Persistent on-disk cache for ad-hoc GA4 / GSC report responses.
+
+Entries are keyed on everything that determines a report (property/site,
+dimensions, metrics, filters, resolved date range, limit). Reports whose end
+date is older than the source's finality window never change again and are
+kept until evicted; reports that touch recent (still settling) days expire
+after FRESH_TTL_SECONDS. Total size is capped with LRU eviction.
+
+Usage:
+    from report_cache import ReportCache, make_key, ttl_for
+
+    cache = ReportCache()
+    key = make_key('ga4', property_id, dimensions, metrics, start, end, limit)
+    blob = cache.get(key)
+    if blob is None:
+        blob = fetch()
+        cache.set(key, blob, ttl_for(end, GA4_FINALITY_DAYS))
+    print(cache.stats())
+"""
+
+import os
+import re
+import json
+import time
+import sqlite3
+import hashlib
+from datetime import datetime, timedelta
+
+CACHE_PATH = os.getenv(
+    'REPORT_CACHE_PATH',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'report_cache.sqlite')
+)
+MAX_CACHE_BYTES = int(os.getenv('REPORT_CACHE_MAX_MB', '200')) * 1024 * 1024
+
+# Days after which reported data is final and can be cached indefinitely
+GSC_FINALITY_DAYS = 3
+GA4_FINALITY_DAYS = 2
+
+# TTL for reports that include days which may still change
+FRESH_TTL_SECONDS = 3600
+
+
+def make_key(*parts):
+    """Build a stable cache key from report parameters."""
+    raw = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+def resolve_date(value, today=None):
+    """Resolve GA4-style relative dates ('today', 'yesterday', 'NdaysAgo') to YYYY-MM-DD."""
+    today = today or datetime.now().date()
+    if value == 'today':
+        return today.strftime('%Y-%m-%d')
+    if value == 'yesterday':
+        return (today - timedelta(days=1)).strftime('%Y-%m-%d')
+    match = re.fullmatch(r'(\d+)daysAgo', value)
+    if match:
+        return (today - timedelta(days=int(match.group(1)))).strftime('%Y-%m-%d')
+    return value
+
+
+def ttl_for(end_date, finality_days):
+    """Return TTL in seconds for a report ending on end_date (None = never expires)."""
+    end = datetime.strptime(resolve_date(end_date), '%Y-%m-%d').date()
+    if end <= datetime.now().date() - timedelta(days=finality_days):
+        return None
+    return FRESH_TTL_SECONDS
+
+
+class ReportCache:
+    """SQLite-backed blob cache with TTL, LRU size eviction and hit/miss stats."""
+
+    def __init__(self, path=None, max_bytes=None):
+        self.path = path or CACHE_PATH
+        self.max_bytes = max_bytes or MAX_CACHE_BYTES
+        self.hits = 0
+        self.misses = 0
+        conn = self._connect()
+        try:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS entries (
+                    key TEXT PRIMARY KEY,
+                    value BLOB,
+                    size INTEGER,
+                    expires_at REAL,
+                    last_access REAL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_last_access ON entries(last_access)")
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _connect(self):
+        # One short-lived connection per call keeps the cache usable from threads
+        return sqlite3.connect(self.path, timeout=30)
+
+    def get(self, key):
+        """Return the cached blob for key, or None on miss/expiry."""
+        now = time.time()
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT value, expires_at FROM entries WHERE key = ?", [key]
+            ).fetchone()
+            if row is None or (row[1] is not None and row[1] < now):
+                if row is not None:
+                    conn.execute("DELETE FROM entries WHERE key = ?", [key])
+                    conn.commit()
+                self.misses += 1
+                return None
+            conn.execute("UPDATE entries SET last_access = ? WHERE key = ?", [now, key])
+            conn.commit()
+            self.hits += 1
+            return row[0]
+        finally:
+            conn.close()
+
+    def set(self, key, value, ttl=None):
+        """Store a blob; ttl in seconds (None = keep until evicted)."""
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        conn = self._connect()
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                [key, value, len(value), expires_at, now]
+            )
+            self._evict(conn, now)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _evict(self, conn, now):
+        """Drop expired entries, then least-recently-used ones until under max_bytes."""
+        conn.execute("DELETE FROM entries WHERE expires_at IS NOT NULL AND expires_at < ?", [now])
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in conn.execute("SELECT key, size FROM entries ORDER BY last_access").fetchall():
+            conn.execute("DELETE FROM entries WHERE key = ?", [key])
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def stats(self):
+        """Return hit/miss counts for this process and on-disk usage."""
+        conn = self._connect()
+        try:
+            entries, size = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+        finally:
+            conn.close()
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': entries,
+            'size_bytes': size,
+        }
+
+    def clear(self):
+        """Remove all cached entries."""
+        conn = self._connect()
+        try:
+            conn.execute("DELETE FROM entries")
+            conn.commit()
+        finally:
+            conn.close()
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Run all warehouse syncs in one process.
+
+Independent sources (ClickHouse, MongoDB, ClickUp, GSC, GA4, BigQuery) run
+concurrently; all writes go through one DuckDB database instance (one cursor
+per task). Derived steps run once their inputs finish. A timing report with
+the critical path is printed at the end, so the total refresh time is bounded
+by the slowest chain rather than the sum of all sources.
+
+Usage:
+    python3 db_api/sync_all.py                      # Sync everything
+    python3 db_api/sync_all.py --days 90            # GSC/GA4 window (default: 30)
+    python3 db_api/sync_all.py --only gsc ga4       # Run selected steps only
+    python3 db_api/sync_all.py --workers 3          # Limit parallel sources
+"""
+
+import os
+import sys
+import time
+import argparse
+import threading
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+import duckdb
+from dotenv import load_dotenv
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+load_dotenv()
+
+WAREHOUSE_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'warehouse.duckdb')
+
+_print_lock = threading.Lock()
+
+
+def log(msg):
+    """Print with timestamp."""
+    with _print_lock:
+        print(f"[{datetime.now().strftime('%H:%M:%S')}] {msg}", flush=True)
+
+
+# ---------------------------------------------------------------------------
+# Steps: each takes a DuckDB cursor and the parsed args, returns rows synced
+# (sync modules are imported inside the step so a missing optional dependency
+# only fails that step)
+# ---------------------------------------------------------------------------
+
+def step_clickhouse(conn, args):
+    import clickhouse_to_duckdb
+    for table in clickhouse_to_duckdb.TABLES:
+        if not clickhouse_to_duckdb.sync_table(conn, table):
+            raise RuntimeError(f"ClickHouse sync failed for {table}")
+    return None
+
+
+def step_mongo(conn, args):
+    import sync_mongo
+    client = sync_mongo.get_mongo_client()
+    try:
+        db = client['getlinks_pro_prod']
+        return sum(sync_mongo.sync_collection(db, conn, config) for config in sync_mongo.COLLECTIONS)
+    finally:
+        client.close()
+
+
+def step_clickup(conn, args):
+    import sync_clickup
+    full_sync = sync_clickup.ensure_tables(conn)
+    new_count, updated_count, _ = sync_clickup.sync_orders(conn, full_sync)
+    return new_count + updated_count
+
+
+def step_gsc(conn, args):
+    import sync_gsc
+    # GSC data has 2-3 day delay
+    end_date = (datetime.now() - timedelta(days=3)).strftime('%Y-%m-%d')
+    start_date = (datetime.now() - timedelta(days=args.days)).strftime('%Y-%m-%d')
+    service = sync_gsc.get_gsc_client()
+    return sum(
+        fn(service, conn, start_date, end_date)
+        for fn in (sync_gsc.sync_daily, sync_gsc.sync_queries, sync_gsc.sync_queries_daily,
+                   sync_gsc.sync_pages, sync_gsc.sync_countries, sync_gsc.sync_devices)
+    )
+
+
+def step_ga4(conn, args):
+    import sync_ga4
+    end_date = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
+    start_date = (datetime.now() - timedelta(days=args.days)).strftime('%Y-%m-%d')
+    client = sync_ga4.get_ga4_client()
+    return sum(
+        fn(client, conn, start_date, end_date)
+        for fn in (sync_ga4.sync_daily, sync_ga4.sync_pages, sync_ga4.sync_sources, sync_ga4.sync_countries)
+    )
+
+
+def step_bigquery(conn, args):
+    import sync_bigquery
+    return sync_bigquery.sync_clarity_data(sync_bigquery.get_bigquery_client(), conn)
+
+
+def step_traffic_daily(conn, args):
+    """Rollup: one row per day with search (GSC) and site (GA4) traffic side by side."""
+    conn.execute("""
+        CREATE OR REPLACE TABLE traffic_daily AS
+        SELECT
+            COALESCE(g.date, a.date) AS date,
+            g.clicks AS gsc_clicks,
+            g.impressions AS gsc_impressions,
+            g.ctr AS gsc_ctr,
+            g.position AS gsc_position,
+            a.sessions AS ga4_sessions,
+            a.total_users AS ga4_users,
+            a.new_users AS ga4_new_users,
+            a.pageviews AS ga4_pageviews,
+            CURRENT_TIMESTAMP AS synced_at
+        FROM gsc_daily g
+        FULL OUTER JOIN ga4_daily a ON g.date = a.date
+        ORDER BY date
+    """)
+    return conn.execute("SELECT COUNT(*) FROM traffic_daily").fetchone()[0]
+
+
+# name -> (function, dependencies)
+STEPS = {
+    'clickhouse': (step_clickhouse, []),
+    'mongo': (step_mongo, []),
+    'clickup': (step_clickup, []),
+    'gsc': (step_gsc, []),
+    'ga4': (step_ga4, []),
+    'bigquery': (step_bigquery, []),
+    'traffic_daily': (step_traffic_daily, ['gsc', 'ga4']),
+}
+
+
+def record_sync_state(conn, results):
+    """Append one sync_state row per successful step."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS sync_state (
+            source VARCHAR,
+            last_sync TIMESTAMP,
+            rows_synced INTEGER
+        )
+    """)
+    rows = [
+        (name, datetime.fromtimestamp(r['end']), r['rows'])
+        for name, r in results.items() if r['status'] == 'ok'
+    ]
+    if rows:
+        conn.executemany("INSERT INTO sync_state VALUES (?, ?, ?)", rows)
+
+
+def run_steps(conn, steps, args):
+    """
+    Run steps respecting dependencies, independent ones in parallel.
+
+    Returns:
+        dict name -> {'status', 'start', 'end', 'rows', 'error'}
+    """
+    results = {}
+    pending = dict(steps)
+    running = {}
+
+    def run(name, fn):
+        cursor = conn.cursor()
+        start = time.time()
+        log(f"START {name}")
+        try:
+            rows = fn(cursor, args)
+            status, error = 'ok', None
+        except (Exception, SystemExit) as e:  # a missing-dependency exit fails only this step
+            rows, status, error = None, 'failed', e
+        finally:
+            cursor.close()
+        end = time.time()
+        log(f"{'DONE' if status == 'ok' else 'FAIL'} {name} ({end - start:.1f}s){f': {error}' if error else ''}")
+        return {'status': status, 'start': start, 'end': end, 'rows': rows, 'error': error}
+
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        while pending or running:
+            for name, (fn, deps) in list(pending.items()):
+                deps = [d for d in deps if d in steps]
+                if any(results.get(d, {}).get('status') in ('failed', 'skipped') for d in deps):
+                    now = time.time()
+                    results[name] = {'status': 'skipped', 'start': now, 'end': now, 'rows': None, 'error': None}
+                    log(f"SKIP {name} (dependency failed)")
+                    del pending[name]
+                elif all(d in results for d in deps):
+                    running[pool.submit(run, name, fn)] = name
+                    del pending[name]
+
+            if not running:
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[running.pop(future)] = future.result()
+
+    return results
+
+
+def critical_path(steps, results):
+    """Walk back from the last step to finish through its latest-finishing dependency."""
+    if not results:
+        return []
+    name = max(results, key=lambda n: results[n]['end'])
+    path = [name]
+    while True:
+        deps = [d for d in steps[name][1] if d in results]
+        if not deps:
+            break
+        name = max(deps, key=lambda d: results[d]['end'])
+        path.append(name)
+    return list(reversed(path))
+
+
+def print_report(steps, results, t0):
+    """Print per-step timings and the critical path."""
+    total = time.time() - t0
+    serial = sum(r['end'] - r['start'] for r in results.values())
+
+    print("=" * 60)
+    print(f"{'Step':<16} {'Status':<8} {'Start':>8} {'Duration':>10} {'Rows':>10}")
+    print("-" * 60)
+    for name, r in sorted(results.items(), key=lambda kv: kv[1]['start']):
+        rows = f"{r['rows']:,}" if isinstance(r['rows'], int) else '-'
+        print(f"{name:<16} {r['status']:<8} {r['start'] - t0:>7.1f}s {r['end'] - r['start']:>9.1f}s {rows:>10}")
+    print("-" * 60)
+
+    path = critical_path(steps, results)
+    path_time = sum(results[n]['end'] - results[n]['start'] for n in path)
+    print(f"Critical path: {' -> '.join(path)} ({path_time:.1f}s)")
+    print(f"Wall time: {total:.1f}s (sequential would be ~{serial:.1f}s)")
+    print("=" * 60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run all warehouse syncs in one process')
+    parser.add_argument('--days', type=int, default=30, help='GSC/GA4 days to sync (default: 30)')
+    parser.add_argument('--only', nargs='+', choices=list(STEPS), help='Run only these steps')
+    parser.add_argument('--workers', type=int, default=len(STEPS), help='Max parallel steps')
+    args = parser.parse_args()
+
+    steps = {name: STEPS[name] for name in (args.only or STEPS)}
+
+    print("=" * 60)
+    print("Warehouse Sync (all sources)")
+    print("=" * 60)
+    log(f"Warehouse: {WAREHOUSE_PATH}")
+    log(f"Steps: {', '.join(steps)}")
+    print("-" * 60)
+
+    conn = duckdb.connect(WAREHOUSE_PATH)
+    t0 = time.time()
+    try:
+        results = run_steps(conn, steps, args)
+        record_sync_state(conn, results)
+    finally:
+        conn.close()
+
+    print_report(steps, results, t0)
+
+    if any(r['status'] != 'ok' for r in results.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
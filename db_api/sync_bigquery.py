@@ -26,20 +26,12 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 load_dotenv()
 
-try:
-    from google.cloud import bigquery
-    from google.oauth2 import service_account
-except ImportError:
-    print("ERROR: Required packages not installed. Run:")
-    print("  pip3 install google-cloud-bigquery google-auth")
-    sys.exit(1)
+from google_bootstrap import require, bigquery_client
+
+require('google.cloud.bigquery', 'google.oauth2', install='google-cloud-bigquery google-auth')
 
 # Configuration
 PROJECT_ID = 'getlinkspro-453615'
-GOOGLE_SERVICE_ACCOUNT_FILE = os.getenv(
-    'GOOGLE_SERVICE_ACCOUNT_FILE',
-    os.path.join(os.path.dirname(__file__), 'getlinkspro-453615-c0e5ea39671a.json')
-)
 WAREHOUSE_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'warehouse.duckdb')
 
 
@@ -49,15 +41,8 @@ def log(msg):
 
 
 def get_bigquery_client():
-    """Initialize BigQuery client."""
-    if not os.path.exists(GOOGLE_SERVICE_ACCOUNT_FILE):
-        raise FileNotFoundError(f"Service account file not found: {GOOGLE_SERVICE_ACCOUNT_FILE}")
-
-    credentials = service_account.Credentials.from_service_account_file(
-        GOOGLE_SERVICE_ACCOUNT_FILE,
-        scopes=['https://www.googleapis.com/auth/bigquery']
-    )
-    return bigquery.Client(credentials=credentials, project=PROJECT_ID)
+    """Initialize BigQuery client (shared per process)."""
+    return bigquery_client(PROJECT_ID)
 
 
 def sync_gsc_data(bq_client, conn, days=None):
@@ -2,20 +2,26 @@
 """
 Sync ClickUp Orders to DuckDB.
 
+Only tasks updated since the last sync are requested (date_updated_gt).
+
 Usage:
-    python3 db_api/sync_clickup.py          # Sync all orders
+    python3 db_api/sync_clickup.py          # Sync new/changed orders
     python3 db_api/sync_clickup.py --init   # Re-create tables and sync
+    python3 db_api/sync_clickup.py --reparse  # Re-parse stored task names in DuckDB
 """
 
 import os
 import sys
 import re
 import argparse
-from datetime import datetime
+import functools
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
-import requests
 import duckdb
 
+from clickup_http import ClickUpSession
+
 load_dotenv()
 
 # ClickUp config
@@ -26,10 +32,17 @@ BASE_URL = "https://api.clickup.com/api/v2"
 # DuckDB config
 DUCKDB_PATH = os.path.join(os.path.dirname(__file__), "..", "warehouse.duckdb")
 
-HEADERS = {
-    "Authorization": CLICKUP_API_KEY,
-    "Content-Type": "application/json"
-}
+# Parallel fetches (task pages, comments / attachments)
+MAX_WORKERS = int(os.getenv("CLICKUP_WORKERS", "8"))
+
+# ClickUp returns at most 100 tasks per page
+PAGE_SIZE = 100
+
+# Re-fetch tasks updated slightly before the last watermark (clock skew safety)
+WATERMARK_OVERLAP = timedelta(minutes=5)
+
+# Shared session: pooled connections, rate limiting and 429 backoff for all requests
+SESSION = ClickUpSession(CLICKUP_API_KEY, pool_size=MAX_WORKERS)
 
 
 def get_connection():
@@ -109,52 +122,69 @@ def ensure_tables(conn):
     return False
 
 
-def parse_task_name(name):
-    """Parse order details from task name."""
-    # Pattern: "ORDER_NUM, TYPE, DOMAIN, $AMOUNT, EMAIL"
-    # Handle optional "ACTION REQUIRED!" prefix
-    pattern = r'^(?:ACTION REQUIRED!\s*)?(\d+),\s*([^,]+),\s*([^,]+),\s*\$?([\d.]+),\s*(.+?)\"?$'
-    match = re.match(pattern, name)
-
-    if match:
-        try:
-            return {
-                "order_number": int(match.group(1)),
-                "order_type": match.group(2).strip(),
-                "domain": match.group(3).strip(),
-                "amount_usd": float(match.group(4)) if match.group(4) and match.group(4) != '.' else None,
-                "customer_email": match.group(5).strip().rstrip('"')
-            }
-        except (ValueError, TypeError):
-            pass
-
-    # Try alternate patterns
-    # Pattern: "ID XX, domain, $amount, email"
-    pattern2 = r'^ID\s*(\d+),?\s*([^,\$]+),?\s*\$?([\d.]+),?\s*(.+?)\"?$'
-    match = re.match(pattern2, name)
+# Full order-name formats as one compiled pattern; alternatives are tried in order:
+#   "ORDER_NUM, TYPE, DOMAIN, $AMOUNT, EMAIL" (optional "ACTION REQUIRED!" prefix)
+#   "ID XX, domain, $amount, email"
+ORDER_NAME_RE = re.compile(r"""
+    ^(?:
+        (?:ACTION\ REQUIRED!\s*)?(?P<num>\d+),\s*(?P<type>[^,]+),\s*(?P<domain>[^,]+),\s*\$?(?P<amount>[\d.]+),\s*(?P<email>.+?)\"?
+      |
+        ID\s*(?P<id_num>\d+),?\s*(?P<id_domain>[^,\$]+),?\s*\$?(?P<id_amount>[\d.]+),?\s*(?P<id_email>.+?)\"?
+    )$
+""", re.VERBOSE)
+ID_NAME_RE = re.compile(r'^ID\s*(\d+),?\s*([^,\$]+),?\s*\$?([\d.]+),?\s*(.+?)\"?$')
+
+# Fallbacks for free-form names
+ORDER_NUM_RE = re.compile(r'^(?:ACTION REQUIRED!\s*)?(?:ID\s*)?(\d+)')
+DOMAIN_RE = re.compile(r'([a-zA-Z0-9][-a-zA-Z0-9]*\.[a-zA-Z]{2,}(?:\.[a-zA-Z]{2,})?)')
+AMOUNT_RE = re.compile(r'\$?([\d]+\.?\d*)')
+EMAIL_RE = re.compile(r'([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})')
+
+PARSED_FIELDS = ("order_number", "order_type", "domain", "amount_usd", "customer_email")
+
+
+def _parse_id_format(num, domain, amount, email):
+    return (
+        int(num),
+        None,
+        domain.strip(),
+        float(amount) if amount and amount != '.' else None,
+        email.strip().rstrip('"')
+    )
+
+
+@functools.lru_cache(maxsize=20000)
+def _parse_task_name(name):
+    """Parse a task name into a PARSED_FIELDS tuple (memoized per name)."""
+    match = ORDER_NAME_RE.match(name)
     if match:
         try:
-            amount = match.group(3)
-            return {
-                "order_number": int(match.group(1)),
-                "order_type": None,
-                "domain": match.group(2).strip(),
-                "amount_usd": float(amount) if amount and amount != '.' else None,
-                "customer_email": match.group(4).strip().rstrip('"')
-            }
+            if match.group("num") is not None:
+                return (
+                    int(match.group("num")),
+                    match.group("type").strip(),
+                    match.group("domain").strip(),
+                    float(match.group("amount")) if match.group("amount") != '.' else None,
+                    match.group("email").strip().rstrip('"')
+                )
+            return _parse_id_format(*match.group("id_num", "id_domain", "id_amount", "id_email"))
         except (ValueError, TypeError):
             pass
 
-    # Try to extract just order number
-    order_match = re.match(r'^(?:ACTION REQUIRED!\s*)?(?:ID\s*)?(\d+)', name)
-    order_num = int(order_match.group(1)) if order_match else None
+        # Full format matched but didn't convert; the ID format may still apply
+        id_match = ID_NAME_RE.match(name)
+        if id_match and match.group("num") is not None:
+            try:
+                return _parse_id_format(*id_match.groups())
+            except (ValueError, TypeError):
+                pass
 
-    # Try to extract domain
-    domain_match = re.search(r'([a-zA-Z0-9][-a-zA-Z0-9]*\.[a-zA-Z]{2,}(?:\.[a-zA-Z]{2,})?)', name)
-    domain = domain_match.group(1) if domain_match else None
+    # Try to extract individual fields
+    order_match = ORDER_NUM_RE.match(name)
+    domain_match = DOMAIN_RE.search(name)
+    amount_match = AMOUNT_RE.search(name)
+    email_match = EMAIL_RE.search(name)
 
-    # Try to extract amount
-    amount_match = re.search(r'\$?([\d]+\.?\d*)', name)
     amount = None
     if amount_match:
         try:
@@ -162,17 +192,51 @@ def parse_task_name(name):
         except ValueError:
             pass
 
-    # Try to extract email
-    email_match = re.search(r'([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})', name)
-    email = email_match.group(1) if email_match else None
+    return (
+        int(order_match.group(1)) if order_match else None,
+        None,
+        domain_match.group(1) if domain_match else None,
+        amount,
+        email_match.group(1) if email_match else None
+    )
+
+
+def parse_task_name(name):
+    """Parse order details from task name."""
+    return dict(zip(PARSED_FIELDS, _parse_task_name(name)))
 
-    return {
-        "order_number": order_num,
-        "order_type": None,
-        "domain": domain,
-        "amount_usd": amount,
-        "customer_email": email
-    }
+
+def register_parse_udf(conn):
+    """Expose the parser to SQL as parse_order_name(name) -> STRUCT."""
+    try:
+        from duckdb.sqltypes import VARCHAR, INTEGER, DOUBLE
+    except ImportError:  # older duckdb
+        from duckdb.typing import VARCHAR, INTEGER, DOUBLE
+
+    return_type = duckdb.struct_type({
+        "order_number": INTEGER,
+        "order_type": VARCHAR,
+        "domain": VARCHAR,
+        "amount_usd": DOUBLE,
+        "customer_email": VARCHAR,
+    })
+    conn.create_function("parse_order_name", parse_task_name, [VARCHAR], return_type)
+
+
+def reparse_orders(conn):
+    """Re-parse all stored task names in bulk (after parser changes)."""
+    register_parse_udf(conn)
+    conn.execute("""
+        UPDATE clickup_orders AS o
+        SET order_number = p.parsed.order_number,
+            order_type = p.parsed.order_type,
+            domain = p.parsed.domain,
+            amount_usd = p.parsed.amount_usd,
+            customer_email = p.parsed.customer_email
+        FROM (SELECT task_id, parse_order_name(name) AS parsed FROM clickup_orders) AS p
+        WHERE o.task_id = p.task_id
+    """)
+    return conn.execute("SELECT COUNT(*) FROM clickup_orders").fetchone()[0]
 
 
 def ts_to_datetime(ts):
@@ -182,20 +246,50 @@ def ts_to_datetime(ts):
     return None
 
 
-def fetch_all_tasks():
-    """Fetch all tasks from Orders list."""
+def fetch_task_page(page, updated_after_ms=None):
+    """Fetch one page of tasks from Orders list.
+
+    Returns:
+        (tasks, last_page)
+    """
     url = f"{BASE_URL}/list/{ORDERS_LIST_ID}/task"
-    params = {"include_closed": "true", "subtasks": "true"}
+    params = {"include_closed": "true", "subtasks": "true", "page": page}
+    if updated_after_ms:
+        params["date_updated_gt"] = updated_after_ms
 
-    response = requests.get(url, headers=HEADERS, params=params)
+    response = SESSION.get(url, params=params)
     response.raise_for_status()
-    return response.json().get("tasks", [])
+    data = response.json()
+    tasks = data.get("tasks", [])
+    return tasks, data.get("last_page", len(tasks) < PAGE_SIZE)
+
+
+def fetch_all_tasks(updated_after=None):
+    """Fetch all tasks from Orders list (only those updated after updated_after, if given).
+
+    Page 0 is fetched alone (incremental syncs usually fit in it); further
+    pages are fetched concurrently in waves of MAX_WORKERS until last_page.
+    """
+    updated_after_ms = int(updated_after.timestamp() * 1000) if updated_after else None
+
+    tasks, last_page = fetch_task_page(0, updated_after_ms)
+    page = 1
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        while not last_page:
+            wave = range(page, page + MAX_WORKERS)
+            for page_tasks, is_last in pool.map(lambda p: fetch_task_page(p, updated_after_ms), wave):
+                tasks.extend(page_tasks)
+                if is_last or not page_tasks:
+                    last_page = True
+                    break
+            page += MAX_WORKERS
+    return tasks
 
 
 def fetch_task_comments(task_id):
     """Fetch comments for a task."""
     url = f"{BASE_URL}/task/{task_id}/comment"
-    response = requests.get(url, headers=HEADERS)
+    response = SESSION.get(url)
     if response.status_code == 200:
         return response.json().get("comments", [])
     return []
@@ -204,116 +298,192 @@ def fetch_task_comments(task_id):
 def fetch_task_attachments(task_id):
     """Fetch full task details to get attachments."""
     url = f"{BASE_URL}/task/{task_id}"
-    response = requests.get(url, headers=HEADERS)
+    response = SESSION.get(url)
     if response.status_code == 200:
         return response.json().get("attachments", [])
     return []
 
 
+def fetch_task_details(task):
+    """Fetch comments and attachments for a task.
+
+    Attachments already present in the list response are reused instead of
+    re-fetching the full task.
+    """
+    comments = fetch_task_comments(task["id"])
+    if "attachments" in task:
+        attachments = task["attachments"]
+    else:
+        attachments = fetch_task_attachments(task["id"])
+    return comments, attachments
+
+
+def fetch_details_concurrently(tasks):
+    """Fetch comments/attachments for many tasks on a bounded thread pool.
+
+    Returns:
+        dict task_id -> (comments, attachments)
+    """
+    if not tasks:
+        return {}
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        results = pool.map(fetch_task_details, tasks)
+        return {task["id"]: details for task, details in zip(tasks, results)}
+
+
+def order_row(task, attachments, now, parsed=None):
+    """Build a clickup_orders row from a task (parsed: reuse already-parsed name fields)."""
+    parsed = parsed or parse_task_name(task["name"])
+    assignees = task.get("assignees", [])
+    return (
+        task["id"],
+        task["name"],
+        parsed["order_number"],
+        parsed["order_type"],
+        parsed["domain"],
+        parsed["amount_usd"],
+        parsed["customer_email"],
+        task["status"]["status"],
+        task["status"].get("type"),
+        ts_to_datetime(task.get("date_created")),
+        ts_to_datetime(task.get("date_updated")),
+        ts_to_datetime(task.get("date_done")),
+        task["creator"]["id"],
+        task["creator"]["username"],
+        task["creator"]["email"],
+        ", ".join([a["username"] for a in assignees]),
+        ", ".join([a["email"] for a in assignees]),
+        task.get("text_content"),
+        task.get("url"),
+        len(attachments),
+        now
+    )
+
+
+def comment_row(comment, task_id, now):
+    """Build a clickup_order_comments row."""
+    return (
+        comment["id"],
+        task_id,
+        comment.get("comment_text"),
+        comment["user"]["id"],
+        comment["user"]["username"],
+        comment["user"]["email"],
+        ts_to_datetime(comment.get("date")),
+        now
+    )
+
+
+def attachment_row(att, task_id, now):
+    """Build a clickup_order_attachments row."""
+    return (
+        att["id"],
+        task_id,
+        att.get("title"),
+        att.get("extension"),
+        att.get("mimetype"),
+        att.get("size"),
+        att.get("url"),
+        ts_to_datetime(att.get("date")),
+        now
+    )
+
+
+def upsert_rows(conn, orders, comments, attachments):
+    """Upsert collected rows, one executemany per table (caller manages the transaction)."""
+    if orders:
+        conn.executemany(
+            f"INSERT OR REPLACE INTO clickup_orders VALUES ({', '.join(['?'] * 21)})", orders
+        )
+    if comments:
+        conn.executemany(
+            f"INSERT OR REPLACE INTO clickup_order_comments VALUES ({', '.join(['?'] * 8)})", comments
+        )
+    if attachments:
+        conn.executemany(
+            f"INSERT OR REPLACE INTO clickup_order_attachments VALUES ({', '.join(['?'] * 9)})", attachments
+        )
+
+
+def apply_rows(conn, orders, comments, attachments):
+    """Upsert collected rows: one executemany per table, all in one transaction."""
+    conn.execute("BEGIN TRANSACTION")
+    try:
+        upsert_rows(conn, orders, comments, attachments)
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+
 def sync_orders(conn, full_sync=False):
-    """Sync orders from ClickUp to DuckDB."""
+    """Sync orders from ClickUp to DuckDB (fetch -> collect -> bulk apply)."""
     now = datetime.now()
 
-    # Get existing task IDs and their update times
+    # Get existing task IDs, their update times and stored parsed name fields
     existing = {}
+    stored_names = {}
     if not full_sync:
         try:
-            rows = conn.execute(
-                "SELECT task_id, date_updated FROM clickup_orders"
-            ).fetchall()
+            rows = conn.execute(f"""
+                SELECT task_id, date_updated, name, {', '.join(PARSED_FIELDS)} FROM clickup_orders
+            """).fetchall()
             existing = {r[0]: r[1] for r in rows}
+            stored_names = {r[0]: (r[2], dict(zip(PARSED_FIELDS, r[3:]))) for r in rows}
         except:
             pass
 
-    # Fetch all tasks
-    print("Fetching tasks from ClickUp...")
-    tasks = fetch_all_tasks()
+    # Fetch tasks (incremental: only those updated since the last sync)
+    watermark = max((d for d in existing.values() if d), default=None)
+    if watermark:
+        watermark -= WATERMARK_OVERLAP
+        print(f"Fetching tasks updated since {watermark} from ClickUp...")
+    else:
+        print("Fetching tasks from ClickUp...")
+    tasks = fetch_all_tasks(updated_after=watermark)
     print(f"Found {len(tasks)} tasks")
 
     new_count = 0
     updated_count = 0
 
+    # Only new or changed tasks need syncing (keyed by id: a task can appear
+    # on two pages if it moved while pages were being fetched)
+    changed = {}
     for task in tasks:
         task_id = task["id"]
         date_updated = ts_to_datetime(task.get("date_updated"))
-
-        # Check if needs update
         if task_id in existing:
             if existing[task_id] and date_updated and existing[task_id] >= date_updated:
                 continue  # No changes
+        changed[task_id] = task
+    changed = list(changed.values())
 
-        # Parse name
-        parsed = parse_task_name(task["name"])
-
-        # Assignees
-        assignee_names = ", ".join([a["username"] for a in task.get("assignees", [])])
-        assignee_emails = ", ".join([a["email"] for a in task.get("assignees", [])])
-
-        # Upsert order
-        conn.execute("""
-            INSERT OR REPLACE INTO clickup_orders VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, [
-            task_id,
-            task["name"],
-            parsed["order_number"],
-            parsed["order_type"],
-            parsed["domain"],
-            parsed["amount_usd"],
-            parsed["customer_email"],
-            task["status"]["status"],
-            task["status"].get("type"),
-            ts_to_datetime(task.get("date_created")),
-            date_updated,
-            ts_to_datetime(task.get("date_done")),
-            task["creator"]["id"],
-            task["creator"]["username"],
-            task["creator"]["email"],
-            assignee_names,
-            assignee_emails,
-            task.get("text_content"),
-            task.get("url"),
-            len(task.get("attachments", [])) if "attachments" in task else 0,
-            now
-        ])
+    print(f"Fetching comments/attachments for {len(changed)} changed tasks ({MAX_WORKERS} workers)...")
+    details = fetch_details_concurrently(changed)
+
+    # Collect rows
+    orders, comments, attachments = {}, {}, {}
+    for task in changed:
+        task_id = task["id"]
+        task_comments, task_attachments = details[task_id]
+
+        # Unchanged names keep their stored parse
+        stored_name, stored_parsed = stored_names.get(task_id, (None, None))
+        parsed = stored_parsed if stored_name == task["name"] else None
+
+        orders[task_id] = order_row(task, task_attachments, now, parsed)
+        for comment in task_comments:
+            comments[comment["id"]] = comment_row(comment, task_id, now)
+        for att in task_attachments:
+            attachments[att["id"]] = attachment_row(att, task_id, now)
 
         if task_id in existing:
             updated_count += 1
         else:
             new_count += 1
 
-        # Sync comments
-        print(f"  Syncing comments for {task_id}...")
-        comments = fetch_task_comments(task_id)
-        for comment in comments:
-            conn.execute("""
-                INSERT OR REPLACE INTO clickup_order_comments VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, [
-                comment["id"],
-                task_id,
-                comment.get("comment_text"),
-                comment["user"]["id"],
-                comment["user"]["username"],
-                comment["user"]["email"],
-                ts_to_datetime(comment.get("date")),
-                now
-            ])
-
-        # Sync attachments (need full task details)
-        attachments = fetch_task_attachments(task_id)
-        for att in attachments:
-            conn.execute("""
-                INSERT OR REPLACE INTO clickup_order_attachments VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, [
-                att["id"],
-                task_id,
-                att.get("title"),
-                att.get("extension"),
-                att.get("mimetype"),
-                att.get("size"),
-                att.get("url"),
-                ts_to_datetime(att.get("date")),
-                now
-            ])
+    apply_rows(conn, list(orders.values()), list(comments.values()), list(attachments.values()))
+    print(f"Saved {len(orders)} orders, {len(comments)} comments, {len(attachments)} attachments")
 
     return new_count, updated_count, len(tasks)
 
@@ -321,10 +491,16 @@ def sync_orders(conn, full_sync=False):
 def main():
     parser = argparse.ArgumentParser(description="Sync ClickUp Orders to DuckDB")
     parser.add_argument("--init", action="store_true", help="Re-create tables")
+    parser.add_argument("--reparse", action="store_true", help="Re-parse stored task names (no API calls)")
     args = parser.parse_args()
 
     conn = get_connection()
 
+    if args.reparse:
+        print(f"Re-parsed {reparse_orders(conn)} orders")
+        conn.close()
+        return
+
     if args.init:
         print("Initializing tables...")
         init_tables(conn)
@@ -336,7 +512,7 @@ def main():
     new_count, updated_count, total = sync_orders(conn, full_sync)
 
     print(f"\nSync complete:")
-    print(f"  Total tasks: {total}")
+    print(f"  Fetched tasks: {total}")
     print(f"  New: {new_count}")
     print(f"  Updated: {updated_count}")
     print(f"  Unchanged: {total - new_count - updated_count}")
@@ -27,26 +27,15 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 load_dotenv()
 
-try:
-    from google.analytics.data_v1beta import BetaAnalyticsDataClient
-    from google.analytics.data_v1beta.types import (
-        RunReportRequest,
-        DateRange,
-        Dimension,
-        Metric,
-    )
-    from google.oauth2 import service_account
-except ImportError:
-    print("ERROR: Required packages not installed. Run:")
-    print("  pip3 install google-analytics-data google-auth")
-    sys.exit(1)
+from google_bootstrap import require, ga4_data_client
+
+require('google.analytics.data_v1beta', 'google.oauth2', 'numpy', 'pandas',
+        install='google-analytics-data google-auth numpy pandas')
+
+from ga4_columns import response_to_frame
 
 # Configuration
 GA4_PROPERTY_ID = os.getenv('GA4_PROPERTY_ID', '480666040')
-GOOGLE_SERVICE_ACCOUNT_FILE = os.getenv(
-    'GOOGLE_SERVICE_ACCOUNT_FILE',
-    os.path.join(os.path.dirname(__file__), 'getlinkspro-453615-c0e5ea39671a.json')
-)
 WAREHOUSE_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'warehouse.duckdb')
 
 
@@ -56,19 +45,14 @@ def log(msg):
 
 
 def get_ga4_client():
-    """Initialize GA4 client."""
-    if not os.path.exists(GOOGLE_SERVICE_ACCOUNT_FILE):
-        raise FileNotFoundError(f"Service account file not found: {GOOGLE_SERVICE_ACCOUNT_FILE}")
-
-    credentials = service_account.Credentials.from_service_account_file(
-        GOOGLE_SERVICE_ACCOUNT_FILE,
-        scopes=['https://www.googleapis.com/auth/analytics.readonly']
-    )
-    return BetaAnalyticsDataClient(credentials=credentials)
+    """Initialize GA4 client (shared per process)."""
+    return ga4_data_client()
 
 
 def fetch_report(client, dimensions, metrics, start_date, end_date, limit=10000):
     """Fetch a GA4 report."""
+    from google.analytics.data_v1beta.types import RunReportRequest, DateRange, Dimension, Metric
+
     property_name = f"properties/{GA4_PROPERTY_ID}"
 
     request = RunReportRequest(
@@ -82,27 +66,6 @@ def fetch_report(client, dimensions, metrics, start_date, end_date, limit=10000)
     return client.run_report(request)
 
 
-def response_to_rows(response, dimensions, metrics):
-    """Convert GA4 response to list of dicts."""
-    rows = []
-    for row in response.rows:
-        data = {}
-        for i, dim in enumerate(dimensions):
-            data[dim] = row.dimension_values[i].value
-        for i, met in enumerate(metrics):
-            val = row.metric_values[i].value
-            # Convert numeric strings
-            try:
-                if '.' in val:
-                    data[met] = float(val)
-                else:
-                    data[met] = int(val)
-            except ValueError:
-                data[met] = val
-        rows.append(data)
-    return rows
-
-
 def sync_daily(client, conn, start_date, end_date):
     """Sync daily traffic overview."""
     log("Fetching daily overview...")
@@ -112,11 +75,11 @@ def sync_daily(client, conn, start_date, end_date):
                'averageSessionDuration', 'bounceRate', 'engagedSessions']
 
     response = fetch_report(client, dimensions, metrics, start_date, end_date)
-    rows = response_to_rows(response, dimensions, metrics)
+    df = response_to_frame(response)
 
-    log(f"  Got {len(rows)} days of data")
+    log(f"  Got {len(df)} days of data")
 
-    if not rows:
+    if df.empty:
         return 0
 
     # Create table and insert
@@ -134,29 +97,18 @@ def sync_daily(client, conn, start_date, end_date):
         )
     """)
 
-    # Upsert data
-    for row in rows:
-        date_str = row['date']
-        date_formatted = f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:]}"
-
-        conn.execute("""
-            INSERT OR REPLACE INTO ga4_daily
-            (date, sessions, total_users, new_users, pageviews,
-             avg_session_duration, bounce_rate, engaged_sessions, synced_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-        """, [
-            date_formatted,
-            row['sessions'],
-            row['totalUsers'],
-            row['newUsers'],
-            row['screenPageViews'],
-            row['averageSessionDuration'],
-            row.get('bounceRate', 0),
-            row.get('engagedSessions', 0)
-        ])
-
-    log(f"  Saved {len(rows)} rows to ga4_daily")
-    return len(rows)
+    # Upsert data (GA4 dates come as YYYYMMDD)
+    conn.execute("""
+        INSERT OR REPLACE INTO ga4_daily
+        (date, sessions, total_users, new_users, pageviews,
+         avg_session_duration, bounce_rate, engaged_sessions, synced_at)
+        SELECT strptime("date", '%Y%m%d')::DATE, sessions, totalUsers, newUsers, screenPageViews,
+               averageSessionDuration, bounceRate, engagedSessions, CURRENT_TIMESTAMP
+        FROM df
+    """)
+
+    log(f"  Saved {len(df)} rows to ga4_daily")
+    return len(df)
 
 
 def sync_pages(client, conn, start_date, end_date):
@@ -167,11 +119,11 @@ def sync_pages(client, conn, start_date, end_date):
     metrics = ['screenPageViews', 'totalUsers', 'averageSessionDuration', 'bounceRate']
 
     response = fetch_report(client, dimensions, metrics, start_date, end_date, limit=5000)
-    rows = response_to_rows(response, dimensions, metrics)
+    df = response_to_frame(response)
 
-    log(f"  Got {len(rows)} pages")
+    log(f"  Got {len(df)} pages")
 
-    if not rows:
+    if df.empty:
         return 0
 
     # Create table (page_path + page_title as key since same path can have different titles)
@@ -195,24 +147,17 @@ def sync_pages(client, conn, start_date, end_date):
         WHERE date_range_start = ? AND date_range_end = ?
     """, [start_date, end_date])
 
-    for row in rows:
-        conn.execute("""
-            INSERT INTO ga4_pages
-            (date_range_start, date_range_end, page_path, page_title,
-             pageviews, users, avg_session_duration, bounce_rate, synced_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-        """, [
-            start_date, end_date,
-            row['pagePath'],
-            row['pageTitle'][:500] if row['pageTitle'] else None,
-            row['screenPageViews'],
-            row['totalUsers'],
-            row['averageSessionDuration'],
-            row.get('bounceRate', 0)
-        ])
-
-    log(f"  Saved {len(rows)} rows to ga4_pages")
-    return len(rows)
+    conn.execute("""
+        INSERT INTO ga4_pages
+        (date_range_start, date_range_end, page_path, page_title,
+         pageviews, users, avg_session_duration, bounce_rate, synced_at)
+        SELECT ?, ?, pagePath, NULLIF(left(pageTitle, 500), ''),
+               screenPageViews, totalUsers, averageSessionDuration, bounceRate, CURRENT_TIMESTAMP
+        FROM df
+    """, [start_date, end_date])
+
+    log(f"  Saved {len(df)} rows to ga4_pages")
+    return len(df)
 
 
 def sync_sources(client, conn, start_date, end_date):
@@ -223,11 +168,11 @@ def sync_sources(client, conn, start_date, end_date):
     metrics = ['sessions', 'totalUsers', 'newUsers', 'bounceRate']
 
     response = fetch_report(client, dimensions, metrics, start_date, end_date, limit=1000)
-    rows = response_to_rows(response, dimensions, metrics)
+    df = response_to_frame(response)
 
-    log(f"  Got {len(rows)} source combinations")
+    log(f"  Got {len(df)} source combinations")
 
-    if not rows:
+    if df.empty:
         return 0
 
     # Create table
@@ -253,25 +198,17 @@ def sync_sources(client, conn, start_date, end_date):
         WHERE date_range_start = ? AND date_range_end = ?
     """, [start_date, end_date])
 
-    for row in rows:
-        conn.execute("""
-            INSERT INTO ga4_sources
-            (date_range_start, date_range_end, source, medium, campaign,
-             sessions, users, new_users, bounce_rate, synced_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-        """, [
-            start_date, end_date,
-            row['sessionSource'],
-            row['sessionMedium'],
-            row.get('sessionCampaignName', '(not set)'),
-            row['sessions'],
-            row['totalUsers'],
-            row['newUsers'],
-            row.get('bounceRate', 0)
-        ])
-
-    log(f"  Saved {len(rows)} rows to ga4_sources")
-    return len(rows)
+    conn.execute("""
+        INSERT INTO ga4_sources
+        (date_range_start, date_range_end, source, medium, campaign,
+         sessions, users, new_users, bounce_rate, synced_at)
+        SELECT ?, ?, sessionSource, sessionMedium, COALESCE(sessionCampaignName, '(not set)'),
+               sessions, totalUsers, newUsers, bounceRate, CURRENT_TIMESTAMP
+        FROM df
+    """, [start_date, end_date])
+
+    log(f"  Saved {len(df)} rows to ga4_sources")
+    return len(df)
 
 
 def sync_countries(client, conn, start_date, end_date):
@@ -282,11 +219,11 @@ def sync_countries(client, conn, start_date, end_date):
     metrics = ['sessions', 'totalUsers', 'screenPageViews']
 
     response = fetch_report(client, dimensions, metrics, start_date, end_date, limit=2000)
-    rows = response_to_rows(response, dimensions, metrics)
+    df = response_to_frame(response)
 
-    log(f"  Got {len(rows)} country/city combinations")
+    log(f"  Got {len(df)} country/city combinations")
 
-    if not rows:
+    if df.empty:
         return 0
 
     # Create table
@@ -310,23 +247,16 @@ def sync_countries(client, conn, start_date, end_date):
         WHERE date_range_start = ? AND date_range_end = ?
     """, [start_date, end_date])
 
-    for row in rows:
-        conn.execute("""
-            INSERT INTO ga4_countries
-            (date_range_start, date_range_end, country, city,
-             sessions, users, pageviews, synced_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-        """, [
-            start_date, end_date,
-            row['country'],
-            row['city'],
-            row['sessions'],
-            row['totalUsers'],
-            row['screenPageViews']
-        ])
-
-    log(f"  Saved {len(rows)} rows to ga4_countries")
-    return len(rows)
+    conn.execute("""
+        INSERT INTO ga4_countries
+        (date_range_start, date_range_end, country, city,
+         sessions, users, pageviews, synced_at)
+        SELECT ?, ?, country, city, sessions, totalUsers, screenPageViews, CURRENT_TIMESTAMP
+        FROM df
+    """, [start_date, end_date])
+
+    log(f"  Saved {len(df)} rows to ga4_countries")
+    return len(df)
 
 
 def main():
@@ -5,6 +5,7 @@ Sync Google Search Console data to local DuckDB warehouse.
 Pulls search performance data and stores in warehouse.duckdb tables:
 - gsc_daily: Daily search performance
 - gsc_queries: Search queries with clicks/impressions
+- gsc_queries_daily: Search queries per date (lets clients answer any sub-range locally)
 - gsc_pages: Page-level search performance
 - gsc_countries: Country breakdown
 
@@ -26,20 +27,12 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 load_dotenv()
 
-try:
-    from google.oauth2 import service_account
-    from googleapiclient.discovery import build
-except ImportError:
-    print("ERROR: Required packages not installed. Run:")
-    print("  pip3 install google-api-python-client google-auth")
-    sys.exit(1)
+from google_bootstrap import require, searchconsole_service
+
+require('googleapiclient', 'google.oauth2', install='google-api-python-client google-auth')
 
 # Configuration
 GSC_SITE_URL = os.getenv('GSC_SITE_URL', 'https://fatgrid.com/')
-GOOGLE_SERVICE_ACCOUNT_FILE = os.getenv(
-    'GOOGLE_SERVICE_ACCOUNT_FILE',
-    os.path.join(os.path.dirname(__file__), 'getlinkspro-453615-c0e5ea39671a.json')
-)
 WAREHOUSE_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'warehouse.duckdb')
 
 
@@ -49,24 +42,18 @@ def log(msg):
 
 
 def get_gsc_client():
-    """Initialize GSC client."""
-    if not os.path.exists(GOOGLE_SERVICE_ACCOUNT_FILE):
-        raise FileNotFoundError(f"Service account file not found: {GOOGLE_SERVICE_ACCOUNT_FILE}")
-
-    credentials = service_account.Credentials.from_service_account_file(
-        GOOGLE_SERVICE_ACCOUNT_FILE,
-        scopes=['https://www.googleapis.com/auth/webmasters.readonly']
-    )
-    return build('searchconsole', 'v1', credentials=credentials)
+    """Initialize GSC client (shared per process)."""
+    return searchconsole_service()
 
 
-def fetch_gsc_data(service, start_date, end_date, dimensions, row_limit=25000):
+def fetch_gsc_data(service, start_date, end_date, dimensions, row_limit=25000, start_row=0):
     """Fetch GSC data for given dimensions."""
     request = {
         'startDate': start_date,
         'endDate': end_date,
         'dimensions': dimensions,
-        'rowLimit': row_limit
+        'rowLimit': row_limit,
+        'startRow': start_row,
     }
 
     response = service.searchanalytics().query(
@@ -77,6 +64,16 @@ def fetch_gsc_data(service, start_date, end_date, dimensions, row_limit=25000):
     return response.get('rows', [])
 
 
+def fetch_all_gsc_data(service, start_date, end_date, dimensions, page_size=25000):
+    """Fetch every row for given dimensions, paging with startRow."""
+    rows = []
+    while True:
+        page = fetch_gsc_data(service, start_date, end_date, dimensions, page_size, start_row=len(rows))
+        rows.extend(page)
+        if len(page) < page_size:
+            return rows
+
+
 def sync_daily(service, conn, start_date, end_date):
     """Sync daily search performance."""
     log("Fetching daily performance...")
@@ -166,6 +163,56 @@ def sync_queries(service, conn, start_date, end_date):
     return len(rows)
 
 
+def sync_queries_daily(service, conn, start_date, end_date):
+    """Sync search queries per date (replaces the dates in the range)."""
+    log("Fetching daily search queries...")
+
+    rows = fetch_all_gsc_data(service, start_date, end_date, ['date', 'query'])
+    log(f"  Got {len(rows)} date/query rows")
+
+    if not rows:
+        return 0
+
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS gsc_queries_daily (
+            date DATE,
+            query VARCHAR,
+            clicks INTEGER,
+            impressions INTEGER,
+            ctr DOUBLE,
+            position DOUBLE,
+            synced_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (date, query)
+        )
+    """)
+
+    conn.execute("BEGIN TRANSACTION")
+    try:
+        conn.execute("DELETE FROM gsc_queries_daily WHERE date BETWEEN ? AND ?", [start_date, end_date])
+        conn.executemany("""
+            INSERT INTO gsc_queries_daily
+            (date, query, clicks, impressions, ctr, position, synced_at)
+            VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+        """, [
+            [
+                row['keys'][0],
+                row['keys'][1],
+                row.get('clicks', 0),
+                row.get('impressions', 0),
+                row.get('ctr', 0),
+                row.get('position', 0)
+            ]
+            for row in rows
+        ])
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+    log(f"  Saved {len(rows)} rows to gsc_queries_daily")
+    return len(rows)
+
+
 def sync_pages(service, conn, start_date, end_date):
     """Sync page-level search data."""
     log("Fetching page performance...")
@@ -350,6 +397,7 @@ def main():
 
         total_rows += sync_daily(service, conn, start_date, end_date)
         total_rows += sync_queries(service, conn, start_date, end_date)
+        total_rows += sync_queries_daily(service, conn, start_date, end_date)
         total_rows += sync_pages(service, conn, start_date, end_date)
         total_rows += sync_countries(service, conn, start_date, end_date)
         total_rows += sync_devices(service, conn, start_date, end_date)
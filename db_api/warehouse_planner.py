@@ -0,0 +1,157 @@
+"""
+Answer ad-hoc GA4 / GSC client queries from the local warehouse.
+
+sync_gsc stores search queries per date (gsc_queries_daily). The planner
+turns the stored dates into covered ranges, clips them to a requested range
+and reports the uncovered gaps, so the clients can answer locally and fetch
+only what is missing from the API (e.g. the last days GSC hasn't finalized).
+
+Only additive metrics can be stitched across ranges: GSC clicks/impressions
+sum, position is re-weighted by impressions and ctr is recomputed. GA4 pages
+are stored as one aggregate per synced range (date_range_start,
+date_range_end) and users / session duration are not additive, so GA4
+reports are answered locally only when a stored range matches exactly.
+
+Usage:
+    from warehouse_planner import daily_ranges, plan_ranges, gsc_query_totals
+
+    local, missing = plan_ranges(daily_ranges('gsc_queries_daily'), start, end)
+"""
+
+import os
+from datetime import date, datetime, timedelta
+
+WAREHOUSE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'warehouse.duckdb')
+
+
+def _to_date(value):
+    """Accept date or YYYY-MM-DD string."""
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(value, '%Y-%m-%d').date()
+
+
+def _query(sql, params=None):
+    """Run a read-only warehouse query; None if the warehouse/table is unavailable."""
+    if not os.path.exists(WAREHOUSE_PATH):
+        return None
+
+    import duckdb
+
+    try:
+        conn = duckdb.connect(WAREHOUSE_PATH, read_only=True)
+    except duckdb.Error:
+        # Locked by a running sync, or not a valid database
+        return None
+    try:
+        return conn.execute(sql, params or []).fetchall()
+    except duckdb.CatalogException:
+        return None
+    finally:
+        conn.close()
+
+
+def synced_ranges(table):
+    """List (start, end) date ranges stored in a range-aggregated sync table."""
+    rows = _query(f"SELECT DISTINCT date_range_start, date_range_end FROM {table}")
+    return [(r[0], r[1]) for r in rows or []]
+
+
+def daily_ranges(table):
+    """List (start, end) runs of consecutive dates stored in a per-date table."""
+    rows = _query(f"""
+        SELECT MIN(date), MAX(date)
+        FROM (
+            SELECT date, date - CAST(ROW_NUMBER() OVER (ORDER BY date) AS INTEGER) AS run
+            FROM (SELECT DISTINCT date FROM {table})
+        )
+        GROUP BY run
+        ORDER BY 1
+    """)
+    return [(r[0], r[1]) for r in rows or []]
+
+
+def plan_ranges(ranges, start_date, end_date):
+    """
+    Split [start_date, end_date] into locally covered ranges and missing gaps.
+
+    Stored ranges that overlap the request are clipped to it, so ranges must
+    come from per-date data (any sub-range can be summed). At each step the
+    covering range reaching furthest is used.
+
+    Returns:
+        (local, missing): lists of (start, end) date tuples, inclusive
+    """
+    start = _to_date(start_date)
+    end = _to_date(end_date)
+    inside = [(max(s, start), min(e, end)) for s, e in ranges if s <= end and e >= start and s <= e]
+
+    local, missing = [], []
+    cursor = start
+    while cursor <= end:
+        candidates = [r for r in inside if r[0] <= cursor <= r[1]]
+        if candidates:
+            best_end = max(e for _, e in candidates)
+            local.append((cursor, best_end))
+            cursor = best_end + timedelta(days=1)
+            continue
+
+        # Gap runs until the next stored range starts (or the request ends)
+        next_starts = [s for s, _ in inside if s > cursor]
+        gap_end = min(next_starts) - timedelta(days=1) if next_starts else end
+        missing.append((cursor, gap_end))
+        cursor = gap_end + timedelta(days=1)
+
+    return local, missing
+
+
+def gsc_query_totals(ranges):
+    """
+    Aggregate gsc_queries_daily over date ranges.
+
+    Returns:
+        dict query -> [clicks, impressions, position * impressions]
+    """
+    totals = {}
+    for start, end in ranges:
+        rows = _query("""
+            SELECT query, SUM(clicks), SUM(impressions), SUM(position * impressions)
+            FROM gsc_queries_daily
+            WHERE date BETWEEN ? AND ?
+            GROUP BY query
+        """, [start, end]) or []
+        for query, clicks, impressions, weighted in rows:
+            t = totals.setdefault(query, [0, 0, 0.0])
+            t[0] += clicks or 0
+            t[1] += impressions or 0
+            t[2] += weighted or 0
+    return totals
+
+
+def ga4_pages_exact(start_date, end_date, limit):
+    """
+    Top pages from ga4_pages for an exactly synced range, or None if not covered.
+
+    Rows are grouped by page_path. ga4_pages is stored per (page_path, page_title);
+    pageviews add up across titles, but users and avg_session_duration don't, so
+    they are None for paths stored under more than one title.
+
+    Returns:
+        list of (page_path, pageviews, users, avg_session_duration)
+    """
+    start = _to_date(start_date)
+    end = _to_date(end_date)
+    if (start, end) not in synced_ranges('ga4_pages'):
+        return None
+
+    return _query("""
+        SELECT page_path,
+               SUM(pageviews) AS pageviews,
+               CASE WHEN COUNT(*) = 1 THEN MAX(users) END AS users,
+               CASE WHEN COUNT(*) = 1 THEN MAX(avg_session_duration) END AS avg_session_duration
+        FROM ga4_pages
+        WHERE date_range_start = ? AND date_range_end = ?
+        GROUP BY page_path
+        ORDER BY pageviews DESC
+        LIMIT ?
+    """, [start, end, limit])
@@ -0,0 +1,86 @@
+"""
+Tests for warehouse_planner and the GSC client's warehouse path.
+
+Run:
+    python3 -m pytest db_api/warehouse_planner_test.py
+"""
+
+import os
+import sys
+from datetime import date, timedelta
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import warehouse_planner
+from warehouse_planner import plan_ranges
+
+
+def d(days_ago):
+    return date.today() - timedelta(days=days_ago)
+
+
+def test_plan_ranges_clips_overlapping_range():
+    # sync_gsc stores dates up to today-3; the default request is today-7 .. today-1
+    local, missing = plan_ranges([(d(30), d(3))], d(7), d(1))
+    assert local == [(d(7), d(3))]
+    assert missing == [(d(2), d(1))]
+
+
+def test_plan_ranges_gaps_between_ranges():
+    local, missing = plan_ranges([(d(20), d(15)), (d(12), d(10))], d(18), d(8))
+    assert local == [(d(18), d(15)), (d(12), d(10))]
+    assert missing == [(d(14), d(13)), (d(9), d(8))]
+
+
+def test_plan_ranges_no_overlap():
+    local, missing = plan_ranges([(d(40), d(30))], d(7), d(1))
+    assert local == []
+    assert missing == [(d(7), d(1))]
+
+
+def test_top_queries_default_window_uses_warehouse(tmp_path, monkeypatch):
+    duckdb = pytest.importorskip('duckdb')
+    pytest.importorskip('dotenv')
+    pytest.importorskip('googleapiclient')
+    pytest.importorskip('google.oauth2')
+    import gsc_client
+
+    warehouse = tmp_path / 'warehouse.duckdb'
+    conn = duckdb.connect(str(warehouse))
+    conn.execute("""
+        CREATE TABLE gsc_queries_daily (
+            date DATE, query VARCHAR, clicks INTEGER, impressions INTEGER,
+            ctr DOUBLE, position DOUBLE, synced_at TIMESTAMP
+        )
+    """)
+    conn.executemany(
+        "INSERT INTO gsc_queries_daily VALUES (?, ?, ?, ?, 0, ?, CURRENT_TIMESTAMP)",
+        [[d(n), 'backlinks', 2, 10, 4.0] for n in range(3, 31)]
+    )
+    conn.close()
+    monkeypatch.setattr(warehouse_planner, 'WAREHOUSE_PATH', str(warehouse))
+
+    credentials = tmp_path / 'service_account.json'
+    credentials.write_text('{}')
+    client = gsc_client.GSCClient(credentials_file=str(credentials), use_cache=False)
+
+    api_calls = []
+
+    def fake_query(start_date, end_date, **kwargs):
+        api_calls.append((start_date, end_date))
+        return {'rows': [{'keys': ['backlinks'], 'clicks': 1, 'impressions': 10, 'position': 2.0}]}
+
+    monkeypatch.setattr(client, 'query', fake_query)
+
+    response = client.get_top_queries()
+
+    # today-7 .. today-3 from the warehouse, only today-2 .. today-1 from the API
+    assert api_calls == [(d(2).isoformat(), d(1).isoformat())]
+    assert response['source'] == 'warehouse+api'
+    row = response['rows'][0]
+    assert row['keys'] == ['backlinks']
+    assert row['clicks'] == 5 * 2 + 1
+    assert row['impressions'] == 5 * 10 + 10
+    assert row['position'] == pytest.approx((5 * 10 * 4.0 + 10 * 2.0) / 60)
@@ -0,0 +1,143 @@
+"""
+Embedding backends for the transcript RAG.
+
+A backend turns texts into vectors and describes itself (name, model,
+dimension) so the RAG can keep one Qdrant collection per backend and key
+cached vectors by model. Indexing splits texts with `batches()` and runs
+`embed_batch()` with up to `concurrency` batches in flight.
+
+- OpenAIBackend: OpenAI embeddings API, batched requests with retry/backoff.
+- LocalBackend: sentence-transformers model on CPU (torch or ONNX runtime),
+  no network or per-token cost; the model parallelizes inference across cores.
+
+Select with EMBEDDING_BACKEND=openai|local (default: openai).
+
+Usage:
+    from embedding_backends import get_backend
+
+    backend = get_backend("local")
+    vectors = backend.embed_batch(["hello", "world"])
+"""
+
+import os
+import time
+import importlib.util
+
+OPENAI_EMBEDDING_MODEL = "text-embedding-3-small"
+OPENAI_EMBEDDING_DIM = 1536
+
+# Multilingual (ru/uk/en) and small enough for CPU
+LOCAL_EMBEDDING_MODEL = os.getenv("LOCAL_EMBEDDING_MODEL", "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2")
+LOCAL_EMBEDDING_RUNTIME = os.getenv("LOCAL_EMBEDDING_RUNTIME", "torch")  # torch | onnx
+LOCAL_BATCH_SIZE = int(os.getenv("LOCAL_EMBEDDING_BATCH_SIZE", "64"))
+
+# Embedding requests: inputs and (estimated) tokens per request, requests in flight
+EMBED_BATCH_SIZE = int(os.getenv("EMBED_BATCH_SIZE", "256"))
+EMBED_BATCH_TOKENS = int(os.getenv("EMBED_BATCH_TOKENS", "100000"))
+EMBED_CONCURRENCY = int(os.getenv("EMBED_CONCURRENCY", "4"))
+EMBED_MAX_RETRIES = 5
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count; errs high for Cyrillic text (~2 chars per token)."""
+    return len(text) // 2 + 1
+
+
+def batch_texts(texts: list[str], max_inputs: int = EMBED_BATCH_SIZE,
+                max_tokens: int = EMBED_BATCH_TOKENS) -> list[list[str]]:
+    """Group texts into request-sized batches, preserving order."""
+    batches, batch, tokens = [], [], 0
+    for text in texts:
+        n = estimate_tokens(text)
+        if batch and (len(batch) >= max_inputs or tokens + n > max_tokens):
+            batches.append(batch)
+            batch, tokens = [], 0
+        batch.append(text)
+        tokens += n
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+class EmbeddingBackend:
+    """Base class: subclasses set name/model/dim and implement embed_batch."""
+
+    name = None
+    model = None
+    dim = None
+    concurrency = 1
+
+    def batches(self, texts: list[str]) -> list[list[str]]:
+        """Split texts into batches for embed_batch."""
+        return batch_texts(texts)
+
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        raise NotImplementedError
+
+
+class OpenAIBackend(EmbeddingBackend):
+    """OpenAI embeddings API."""
+
+    name = "openai"
+    concurrency = EMBED_CONCURRENCY
+
+    def __init__(self, model: str = OPENAI_EMBEDDING_MODEL, dim: int = OPENAI_EMBEDDING_DIM):
+        from openai import OpenAI, RateLimitError, APIConnectionError, APITimeoutError, InternalServerError
+
+        self.model = model
+        self.dim = dim
+        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self.retryable = (RateLimitError, APIConnectionError, APITimeoutError, InternalServerError)
+
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Embed one batch in a single request, retrying with backoff."""
+        for attempt in range(EMBED_MAX_RETRIES + 1):
+            try:
+                response = self.client.embeddings.create(input=texts, model=self.model)
+                return [d.embedding for d in sorted(response.data, key=lambda d: d.index)]
+            except self.retryable:
+                if attempt == EMBED_MAX_RETRIES:
+                    raise
+                time.sleep(2 ** attempt)
+
+
+class LocalBackend(EmbeddingBackend):
+    """sentence-transformers model running locally on CPU."""
+
+    name = "local"
+
+    def __init__(self, model: str = LOCAL_EMBEDDING_MODEL, runtime: str = LOCAL_EMBEDDING_RUNTIME):
+        if importlib.util.find_spec("sentence_transformers") is None:
+            raise ImportError(
+                "Local embeddings need sentence-transformers. Run:\n"
+                "  pip3 install sentence-transformers" + (" onnxruntime optimum" if runtime == "onnx" else "")
+            )
+        from sentence_transformers import SentenceTransformer
+
+        self.model = model
+        self.encoder = SentenceTransformer(model, device="cpu", backend=runtime)
+        self.dim = self.encoder.get_sentence_embedding_dimension()
+
+    def batches(self, texts: list[str]) -> list[list[str]]:
+        # encode() batches internally; larger groups just bound memory and report progress
+        return [texts[i:i + LOCAL_BATCH_SIZE * 8] for i in range(0, len(texts), LOCAL_BATCH_SIZE * 8)]
+
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        vectors = self.encoder.encode(
+            texts, batch_size=LOCAL_BATCH_SIZE, normalize_embeddings=True, show_progress_bar=False
+        )
+        return vectors.tolist()
+
+
+BACKENDS = {
+    "openai": OpenAIBackend,
+    "local": LocalBackend,
+}
+
+
+def get_backend(name: str = None) -> EmbeddingBackend:
+    """Instantiate a backend by name (default: EMBEDDING_BACKEND env or 'openai')."""
+    name = name or os.getenv("EMBEDDING_BACKEND", "openai")
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown embedding backend: {name} (choose from {', '.join(BACKENDS)})")
+    return BACKENDS[name]()
@@ -0,0 +1,75 @@
+"""
+Persistent content-addressed cache for chunk embeddings.
+
+Vectors are keyed by sha256(model, text), so re-indexing a transcript,
+rebuilding the Qdrant collection (force-embed) or re-chunking with slightly
+different parameters only pays for chunks whose text actually changed.
+Stored as float32 blobs in SQLite; when the cache grows past
+EMBEDDING_CACHE_MAX_MB the oldest vectors are dropped.
+
+Usage:
+    from embedding_cache import EmbeddingCache
+
+    cache = EmbeddingCache()
+    vectors = cache.get_many(model, texts)        # None for misses
+    cache.set_many(model, missing_texts, missing_vectors)
+"""
+
+import os
+import sqlite3
+import hashlib
+from array import array
+from contextlib import closing
+from pathlib import Path
+
+CACHE_PATH = os.getenv(
+    "EMBEDDING_CACHE_PATH",
+    str(Path(__file__).parent / "fathom_data" / "embedding_cache.sqlite")
+)
+MAX_CACHE_BYTES = int(os.getenv("EMBEDDING_CACHE_MAX_MB", "500")) * 1024 * 1024
+
+# SQLite's default limit on host parameters per statement is 999
+_SQL_BATCH = 500
+
+
+def make_key(model: str, text: str) -> str:
+    """Cache key for an embedding of text by model."""
+    return hashlib.sha256(f"{model}\0{text}".encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """SQLite table of key -> float32 vector blob, oldest-first eviction."""
+
+    def __init__(self, path: str = None, max_bytes: int = None):
+        self.path = path or CACHE_PATH
+        self.max_bytes = max_bytes or MAX_CACHE_BYTES
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        with closing(sqlite3.connect(self.path, timeout=30)) as conn, conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB)")
+
+    def get_many(self, model: str, texts: list[str]) -> list:
+        """Return cached vectors for texts (None where missing), in order."""
+        keys = [make_key(model, text) for text in texts]
+        found = {}
+        with closing(sqlite3.connect(self.path, timeout=30)) as conn:
+            for i in range(0, len(keys), _SQL_BATCH):
+                part = keys[i:i + _SQL_BATCH]
+                found.update(conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({', '.join('?' * len(part))})", part
+                ).fetchall())
+        return [array("f", found[key]).tolist() if key in found else None for key in keys]
+
+    def set_many(self, model: str, texts: list[str], vectors: list[list[float]]):
+        """Store vectors for texts, then drop the oldest rows beyond max_bytes."""
+        rows = [(make_key(model, text), array("f", vector).tobytes()) for text, vector in zip(texts, vectors)]
+        with closing(sqlite3.connect(self.path, timeout=30)) as conn, conn:
+            conn.executemany("INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)", rows)
+            # rowid grows with insertion order; keep the newest rows that fit in max_bytes
+            conn.execute("""
+                DELETE FROM embeddings WHERE rowid <= (
+                    SELECT MAX(rowid) FROM (
+                        SELECT rowid, SUM(length(vector)) OVER (ORDER BY rowid DESC) AS newer_bytes
+                        FROM embeddings
+                    ) WHERE newer_bytes > ?
+                )
+            """, [self.max_bytes])
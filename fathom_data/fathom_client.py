@@ -1,12 +1,20 @@
 import os
 import hmac
+import time
 import hashlib
 import base64
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 
 load_dotenv()
 
+MAX_RETRIES = 5
+REQUEST_TIMEOUT = 60
+# Only these are retried after a timeout or 5xx: a POST may have succeeded server-side
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
 
 class FathomClient:
     BASE_URL = "https://api.fathom.ai/external/v1"
@@ -19,10 +27,50 @@ class FathomClient:
             "X-Api-Key": self.api_key,
             "Content-Type": "application/json"
         }
+        # Pooled keep-alive connections, shared by concurrent downloads
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
+        # When rate limited, all threads pause until this wall-clock time
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _wait_for_rate_limit(self):
+        with self._lock:
+            wait = self._blocked_until - time.time()
+        if wait > 0:
+            time.sleep(wait)
 
     def _request(self, method: str, endpoint: str, **kwargs) -> dict:
+        """
+        Send a request; retries 429 (honouring Retry-After / RateLimit-Reset) for any method,
+        and 5xx and connection errors for idempotent methods (POST only if it never connected).
+        """
         url = f"{self.BASE_URL}/{endpoint}"
-        response = requests.request(method, url, headers=self.headers, **kwargs)
+        kwargs.setdefault("timeout", REQUEST_TIMEOUT)
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        for attempt in range(MAX_RETRIES + 1):
+            backoff = 2 ** attempt
+            self._wait_for_rate_limit()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == MAX_RETRIES or not (idempotent or isinstance(e, requests.ConnectTimeout)):
+                    raise
+                time.sleep(backoff)
+                continue
+
+            if attempt < MAX_RETRIES and response.status_code == 429:
+                delay = response.headers.get("Retry-After") or response.headers.get("RateLimit-Reset") or ""
+                delay = float(delay) if delay.isdigit() else backoff
+                with self._lock:
+                    self._blocked_until = max(self._blocked_until, time.time() + delay)
+                continue
+            if attempt < MAX_RETRIES and response.status_code >= 500 and idempotent:
+                time.sleep(backoff)
+                continue
+            break
+
         response.raise_for_status()
         if response.text:
             return response.json()
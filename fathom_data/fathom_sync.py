@@ -8,12 +8,16 @@ Only fetches new calls since last sync.
 import os
 import sys
 import json
-from datetime import datetime
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from dotenv import load_dotenv
 
 from fathom_client import FathomClient
 from transcript_rag import TranscriptRAG
+from transcript_store import TranscriptStore
 
 load_dotenv()
 
@@ -25,6 +29,28 @@ def log(msg: str):
 DATA_DIR = Path(__file__).parent / "fathom_data"
 TRANSCRIPTS_DIR = DATA_DIR / "transcripts"
 SYNC_STATE_FILE = DATA_DIR / "sync_state.json"
+# Per-recording updates are appended here and folded into SYNC_STATE_FILE on compaction
+SYNC_JOURNAL_FILE = DATA_DIR / "sync_state.journal"
+JOURNAL_COMPACT_ENTRIES = 500
+
+# Concurrent transcript downloads (FathomClient backs off on rate limits)
+SYNC_WORKERS = int(os.getenv("FATHOM_SYNC_WORKERS", "4"))
+
+# Incremental listing: the watermark trails each sync's start by this overlap
+# (covers recordings that finish processing after the previous sync ran)
+SYNC_OVERLAP = timedelta(hours=int(os.getenv("FATHOM_SYNC_OVERLAP_HOURS", "24")))
+
+# Meetings still without a transcript after this long stop holding the watermark back
+# (no recording / failed processing); `force-sync` still picks them up if one appears
+MAX_PENDING_AGE = timedelta(days=int(os.getenv("FATHOM_MAX_PENDING_DAYS", "14")))
+
+# sync-embed pipeline: items buffered between stages, chunks per embedding call
+PIPELINE_QUEUE_SIZE = 8
+PIPELINE_EMBED_CHUNKS = 256
+_DONE = object()  # end-of-stream marker between pipeline stages
+
+# Request transcripts inline in the meeting listing instead of one request per meeting
+INLINE_TRANSCRIPTS = os.getenv("FATHOM_INLINE_TRANSCRIPTS", "").lower() in ("1", "true", "yes")
 
 
 class FathomSync:
@@ -32,7 +58,17 @@ class FathomSync:
         self.fathom = FathomClient()
         self.rag = TranscriptRAG()
         self._ensure_dirs()
+        self._state_lock = threading.RLock()  # sync state is updated from pipeline threads
         self.sync_state = self._load_sync_state()
+        self.store = self._open_store()
+
+    def _open_store(self) -> TranscriptStore | None:
+        """Structured transcript tables in the warehouse; sync still works without them."""
+        try:
+            return TranscriptStore()
+        except Exception as e:
+            log(f"Transcript store disabled: {e}")
+            return None
 
     def _ensure_dirs(self):
         """Create data directories if they don't exist."""
@@ -40,19 +76,53 @@ class FathomSync:
         TRANSCRIPTS_DIR.mkdir(exist_ok=True)
 
     def _load_sync_state(self) -> dict:
-        """Load sync state from file."""
-        if SYNC_STATE_FILE.exists():
-            with open(SYNC_STATE_FILE) as f:
-                return json.load(f)
-        return {
+        """Load sync state: the snapshot file plus any journaled updates."""
+        state = {
             "last_sync": None,
             "synced_recordings": {},  # recording_id -> {"synced_at": ..., "embedded": bool}
         }
+        if SYNC_STATE_FILE.exists():
+            with open(SYNC_STATE_FILE) as f:
+                state = json.load(f)
+
+        self._journal_entries = 0
+        if SYNC_JOURNAL_FILE.exists():
+            with open(SYNC_JOURNAL_FILE) as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        break  # torn last write
+                    if "recording_id" in entry:
+                        state["synced_recordings"][entry["recording_id"]] = entry["info"]
+                    if "last_sync" in entry:
+                        state["last_sync"] = entry["last_sync"]
+                    self._journal_entries += 1
+        return state
+
+    def _journal(self, entry: dict):
+        """Append one update to the journal; compact when it grows large."""
+        with open(SYNC_JOURNAL_FILE, "a") as f:
+            f.write(json.dumps(entry) + "\n")
+        self._journal_entries += 1
+        if self._journal_entries >= JOURNAL_COMPACT_ENTRIES:
+            self._save_sync_state()
+
+    def _record_recording(self, recording_id: str, info: dict):
+        """Update one recording's state (O(1) append, not a full rewrite)."""
+        with self._state_lock:
+            self.sync_state["synced_recordings"][recording_id] = info
+            self._journal({"recording_id": recording_id, "info": info})
 
     def _save_sync_state(self):
-        """Save sync state to file."""
-        with open(SYNC_STATE_FILE, "w") as f:
-            json.dump(self.sync_state, f, indent=2)
+        """Compact: write the full state snapshot atomically and reset the journal."""
+        with self._state_lock:
+            tmp_path = SYNC_STATE_FILE.with_suffix(".json.tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(self.sync_state, f, indent=2)
+            os.replace(tmp_path, SYNC_STATE_FILE)
+            SYNC_JOURNAL_FILE.unlink(missing_ok=True)
+            self._journal_entries = 0
 
     def _get_transcript_path(self, recording_id: int, meeting_title: str, date: str) -> Path:
         """Get path for storing a transcript."""
@@ -63,89 +133,162 @@ class FathomSync:
         filename = f"{date_str}_{recording_id}_{safe_title}.txt"
         return TRANSCRIPTS_DIR / filename
 
-    def sync(self, force: bool = False) -> dict:
+    @staticmethod
+    def _format_transcript(meeting: dict, transcript_entries: list) -> str:
+        """Format a meeting's transcript as the text file layout."""
+        title = meeting.get("meeting_title") or meeting.get("title", "Untitled")
+        lines = []
+        lines.append(f"MEETING: {title}")
+        lines.append(f"DATE: {meeting['created_at']}")
+        lines.append(f"RECORDING_ID: {meeting['recording_id']}")
+        lines.append(f"URL: {meeting.get('url', '')}")
+        lines.append(f"INVITEES: {', '.join(i.get('email', '') for i in meeting.get('calendar_invitees', []))}")
+        lines.append("=" * 80)
+        lines.append("")
+
+        for entry in transcript_entries:
+            speaker = entry["speaker"]["display_name"]
+            text = entry["text"]
+            timestamp = entry["timestamp"]
+            lines.append(f"[{timestamp}] {speaker}: {text}")
+        return "\n".join(lines)
+
+    def _created_after(self) -> str | None:
+        """Listing watermark as UTC ISO 8601 (None = full listing)."""
+        if self.sync_state.get("created_after"):
+            return self.sync_state["created_after"]
+        if not self.sync_state["last_sync"]:
+            return None
+        # State written before the watermark was stored: last_sync minus SYNC_OVERLAP
+        watermark = datetime.fromisoformat(self.sync_state["last_sync"]) - SYNC_OVERLAP
+        return watermark.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    def _finish_sync(self, sync_started: datetime, unfinished: list):
         """
-        Sync transcripts from Fathom.
+        Record the run and advance the listing watermark: sync start minus
+        SYNC_OVERLAP, but never past the oldest meeting that failed to download
+        or had no transcript yet, so the next run lists (and retries) it again.
+        Meetings older than MAX_PENDING_AGE are given up on.
+        """
+        watermark = (sync_started - SYNC_OVERLAP).astimezone(timezone.utc)
+        oldest_retry = (sync_started - MAX_PENDING_AGE).astimezone(timezone.utc)
+        for meeting in unfinished:
+            created_at = datetime.fromisoformat(meeting["created_at"].replace("Z", "+00:00"))
+            if created_at.astimezone(timezone.utc) < oldest_retry:
+                title = meeting.get("meeting_title") or meeting.get("title", "Untitled")
+                log(f"GIVING UP: {title[:40]} ({meeting['created_at'][:10]}) - no transcript after "
+                    f"{MAX_PENDING_AGE.days} days, no longer retried")
+                continue
+            watermark = min(watermark, created_at.astimezone(timezone.utc))
+        self.sync_state["last_sync"] = sync_started.isoformat()
+        self.sync_state["created_after"] = watermark.strftime("%Y-%m-%dT%H:%M:%SZ")
+        self._save_sync_state()
 
-        Args:
-            force: If True, re-fetch all transcripts even if already synced
+    def _fetch_transcript(self, meeting: dict) -> list:
+        """Transcript entries for a meeting (inline from the listing when present)."""
+        if meeting.get("transcript") is not None:
+            return meeting["transcript"]
+        return self.fathom.get_transcript(meeting["recording_id"]).get("transcript", [])
 
-        Returns:
-            Dict with sync stats
-        """
-        log("Fetching meetings from Fathom...")
+    def _list_meetings(self, force: bool, inline_transcripts: bool) -> tuple[list, int]:
+        """List meetings to download; returns (meetings, skipped_count)."""
+        created_after = None if force else self._created_after()
+        log(f"Fetching meetings from Fathom{f' created after {created_after}' if created_after else ''}...")
 
-        # Get all meetings
-        meetings = self.fathom.get_all_meetings()
-        total = len(meetings)
-        log(f"Found {total} total meetings")
+        meetings = self.fathom.get_all_meetings(
+            created_after=created_after, include_transcript=inline_transcripts
+        )
+        log(f"Found {len(meetings)} meetings")
 
-        new_count = 0
+        to_sync = []
         skipped_count = 0
-        error_count = 0
-
-        for i, meeting in enumerate(meetings, 1):
+        for meeting in meetings:
             recording_id = str(meeting["recording_id"])
-            title = meeting.get("meeting_title") or meeting.get("title", "Untitled")
-            date = meeting["created_at"]
-
             # Skip if already synced (unless force)
             if not force and recording_id in self.sync_state["synced_recordings"]:
                 skipped_count += 1
-                log(f"[{i}/{total}] SKIP: {title[:40]} ({date[:10]})")
                 continue
+            to_sync.append(meeting)
+        log(f"{len(to_sync)} to download, {skipped_count} already synced")
+        return to_sync, skipped_count
 
-            log(f"[{i}/{total}] SYNC: {title[:40]} ({date[:10]})...")
-
+    def _iter_downloads(self, meetings: list):
+        """
+        Download transcripts concurrently (SYNC_WORKERS at a time).
+        Yields (log prefix, meeting, transcript entries, error) as each completes.
+        """
+        with ThreadPoolExecutor(max_workers=SYNC_WORKERS) as pool:
+            futures = {pool.submit(self._fetch_transcript, meeting): meeting for meeting in meetings}
+            for i, future in enumerate(as_completed(futures), 1):
+                meeting = futures[future]
+                title = meeting.get("meeting_title") or meeting.get("title", "Untitled")
+                prefix = f"[{i}/{len(meetings)}] {title[:40]} ({meeting['created_at'][:10]})"
+                try:
+                    yield prefix, meeting, future.result(), None
+                except Exception as e:
+                    yield prefix, meeting, None, e
+
+    def _save_transcript(self, meeting: dict, transcript_entries: list) -> tuple[str, dict, str]:
+        """Write the formatted transcript and record it; returns (recording_id, info, text)."""
+        recording_id = str(meeting["recording_id"])
+        title = meeting.get("meeting_title") or meeting.get("title", "Untitled")
+        date = meeting["created_at"]
+        text = self._format_transcript(meeting, transcript_entries)
+
+        transcript_path = self._get_transcript_path(meeting["recording_id"], title, date)
+        with open(transcript_path, "w") as f:
+            f.write(text)
+        if self.store:
             try:
-                transcript_data = self.fathom.get_transcript(meeting["recording_id"])
-                transcript_entries = transcript_data.get("transcript", [])
+                self.store.write_meeting(meeting, transcript_entries)
+            except Exception as e:  # e.g. warehouse locked by another writer; `import` backfills later
+                log(f"WARN: {title[:40]} not written to warehouse: {e}")
+
+        info = {
+            "synced_at": datetime.now().isoformat(),
+            "embedded": False,
+            "file": str(transcript_path),
+            "title": title,
+            "date": date,
+        }
+        self._record_recording(recording_id, info)
+        return recording_id, info, text
 
-                if not transcript_entries:
-                    log(f"         No transcript available")
-                    continue
+    def sync(self, force: bool = False, inline_transcripts: bool = INLINE_TRANSCRIPTS) -> dict:
+        """
+        Sync transcripts from Fathom.
 
-                # Format transcript
-                lines = []
-                lines.append(f"MEETING: {title}")
-                lines.append(f"DATE: {date}")
-                lines.append(f"RECORDING_ID: {recording_id}")
-                lines.append(f"URL: {meeting.get('url', '')}")
-                lines.append(f"INVITEES: {', '.join(i.get('email', '') for i in meeting.get('calendar_invitees', []))}")
-                lines.append("=" * 80)
-                lines.append("")
-
-                for entry in transcript_entries:
-                    speaker = entry["speaker"]["display_name"]
-                    text = entry["text"]
-                    timestamp = entry["timestamp"]
-                    lines.append(f"[{timestamp}] {speaker}: {text}")
-
-                # Save to file
-                transcript_path = self._get_transcript_path(
-                    meeting["recording_id"], title, date
-                )
-                with open(transcript_path, "w") as f:
-                    f.write("\n".join(lines))
-
-                # Update sync state (save after each to avoid losing progress)
-                self.sync_state["synced_recordings"][recording_id] = {
-                    "synced_at": datetime.now().isoformat(),
-                    "embedded": False,
-                    "file": str(transcript_path),
-                    "title": title,
-                    "date": date,
-                }
-                self._save_sync_state()
-                new_count += 1
-                log(f"         Saved ({len(transcript_entries)} entries)")
+        Only meetings created after the stored watermark are listed (see
+        _finish_sync). Transcripts are downloaded concurrently (SYNC_WORKERS at a
+        time); files and sync state are written as each download completes.
 
-            except Exception as e:
-                log(f"         ERROR: {e}")
+        Args:
+            force: If True, list all meetings and re-fetch all transcripts
+            inline_transcripts: Request transcripts inside the listing pages
+
+        Returns:
+            Dict with sync stats
+        """
+        sync_started = datetime.now()
+        to_sync, skipped_count = self._list_meetings(force, inline_transcripts)
+
+        new_count = 0
+        error_count = 0
+        unfinished = []
+        for prefix, meeting, transcript_entries, error in self._iter_downloads(to_sync):
+            if error:
+                log(f"{prefix}: ERROR: {error}")
                 error_count += 1
+                unfinished.append(meeting)
+            elif not transcript_entries:
+                log(f"{prefix}: no transcript available")
+                unfinished.append(meeting)
+            else:
+                self._save_transcript(meeting, transcript_entries)
+                new_count += 1
+                log(f"{prefix}: saved ({len(transcript_entries)} entries)")
 
-        self.sync_state["last_sync"] = datetime.now().isoformat()
-        self._save_sync_state()
+        self._finish_sync(sync_started, unfinished)
 
         log(f"\n=== Sync complete: {new_count} new, {skipped_count} skipped, {error_count} errors ===")
         return {
@@ -155,6 +298,14 @@ class FathomSync:
             "total": len(self.sync_state["synced_recordings"]),
         }
 
+    def _reset_embeddings(self):
+        """Clear the vector index and mark every transcript as not embedded."""
+        log("Force re-embedding: clearing vector index (cached embeddings are reused)...")
+        self.rag.clear()
+        for rec_id in self.sync_state["synced_recordings"]:
+            self.sync_state["synced_recordings"][rec_id]["embedded"] = False
+        self._save_sync_state()
+
     def embed(self, force: bool = False) -> dict:
         """
         Embed unembedded transcripts into the RAG system.
@@ -166,10 +317,7 @@ class FathomSync:
             Dict with embedding stats
         """
         if force:
-            log("Force re-embedding: clearing existing embeddings...")
-            self.rag.clear()
-            for rec_id in self.sync_state["synced_recordings"]:
-                self.sync_state["synced_recordings"][rec_id]["embedded"] = False
+            self._reset_embeddings()
 
         to_embed = [
             (rec_id, info)
@@ -194,10 +342,11 @@ class FathomSync:
             log(f"[{i}/{total}] EMBED: {info['title'][:40]} ({info['date'][:10]})")
             self.rag.index_transcript_file(file_path)
 
-            self.sync_state["synced_recordings"][rec_id]["embedded"] = True
-            self._save_sync_state()
+            self._record_recording(rec_id, {**info, "embedded": True})
             embedded_count += 1
 
+        self._save_sync_state()
+
         stats = self.rag.get_stats()
         log(f"\n=== Embedding complete: {embedded_count} embedded, {stats['total_chunks']} total chunks ===")
         return {
@@ -205,11 +354,179 @@ class FathomSync:
             "total_chunks": stats["total_chunks"],
         }
 
-    def sync_and_embed(self, force: bool = False) -> dict:
-        """Sync from Fathom and embed new transcripts."""
-        sync_stats = self.sync(force=force)
-        embed_stats = self.embed(force=force)
-        return {"sync": sync_stats, "embed": embed_stats}
+    def sync_and_embed(self, force: bool = False, inline_transcripts: bool = INLINE_TRANSCRIPTS) -> dict:
+        """
+        Sync from Fathom and embed new transcripts as one pipeline:
+
+            download (SYNC_WORKERS threads) -> format + save -> chunk -> embed batch -> upsert
+
+        Stages run concurrently, connected by bounded queues, and each
+        downloaded transcript goes to the chunker from memory. Previously
+        synced but unembedded transcripts are fed in from disk first.
+
+        If a stage fails, it keeps draining its input so upstream stages can
+        finish; the error is re-raised after all stages stop, and the listing
+        watermark is not advanced (the next run lists the same meetings again).
+        """
+        if force:
+            self._reset_embeddings()
+
+        sync_started = datetime.now()
+        to_sync, skipped_count = self._list_meetings(force, inline_transcripts)
+        downloading = {str(meeting["recording_id"]) for meeting in to_sync}
+        pending = [
+            (rec_id, info) for rec_id, info in self.sync_state["synced_recordings"].items()
+            if not info.get("embedded") and rec_id not in downloading
+            and info.get("file") and Path(info["file"]).exists()
+        ]
+
+        chunk_queue = queue.Queue(PIPELINE_QUEUE_SIZE)
+        embed_queue = queue.Queue(PIPELINE_QUEUE_SIZE)
+        upsert_queue = queue.Queue(PIPELINE_QUEUE_SIZE)
+        stats = {"new": 0, "errors": 0, "embed_errors": 0, "embedded": 0}
+        unfinished = []
+        failures = []  # exceptions that stopped a stage
+
+        def drain(q: queue.Queue):
+            """Discard a failed stage's input until _DONE, so its producer never blocks."""
+            while q.get() is not _DONE:
+                pass
+
+        def download():
+            try:
+                for rec_id, info in pending:
+                    chunk_queue.put((rec_id, info, Path(info["file"]).read_text()))
+                for prefix, meeting, transcript_entries, error in self._iter_downloads(to_sync):
+                    if failures:
+                        break  # a later stage died; stop downloading
+                    if error:
+                        log(f"{prefix}: ERROR: {error}")
+                        stats["errors"] += 1
+                        unfinished.append(meeting)
+                    elif not transcript_entries:
+                        log(f"{prefix}: no transcript available")
+                        unfinished.append(meeting)
+                    else:
+                        saved = self._save_transcript(meeting, transcript_entries)
+                        stats["new"] += 1
+                        log(f"{prefix}: saved ({len(transcript_entries)} entries)")
+                        chunk_queue.put(saved)
+            except Exception as e:
+                failures.append(e)
+            finally:
+                chunk_queue.put(_DONE)
+
+        def chunk():
+            try:
+                while (item := chunk_queue.get()) is not _DONE:
+                    rec_id, info, text = item
+                    embed_queue.put((rec_id, info, self.rag.chunk_transcript(text)))
+            except Exception as e:
+                failures.append(e)
+                drain(chunk_queue)
+            finally:
+                embed_queue.put(_DONE)
+
+        def embed():
+            done = False
+            try:
+                while not done:
+                    # Group whole transcripts into one embedding call, up to PIPELINE_EMBED_CHUNKS
+                    batch = [embed_queue.get()]
+                    while batch[-1] is not _DONE and sum(len(b[2]) for b in batch) < PIPELINE_EMBED_CHUNKS:
+                        try:
+                            batch.append(embed_queue.get_nowait())
+                        except queue.Empty:
+                            break
+                    if batch[-1] is _DONE:
+                        done = True
+                        batch.pop()
+                    if not batch:
+                        continue
+
+                    try:
+                        embeddings = self.rag.embed_texts([c["text"] for _, _, chunks in batch for c in chunks])
+                    except Exception as e:
+                        log(f"EMBED ERROR ({len(batch)} transcripts): {e}")
+                        stats["embed_errors"] += len(batch)
+                        continue
+                    offset = 0
+                    for rec_id, info, chunks in batch:
+                        upsert_queue.put((rec_id, info, chunks, embeddings[offset:offset + len(chunks)]))
+                        offset += len(chunks)
+            except Exception as e:
+                failures.append(e)
+                if not done:
+                    drain(embed_queue)
+            finally:
+                upsert_queue.put(_DONE)
+
+        stages = [threading.Thread(target=fn, daemon=True) for fn in (download, chunk, embed)]
+        for stage in stages:
+            stage.start()
+
+        # Upsert stage runs here: a single writer to Qdrant and the sync state
+        try:
+            while (item := upsert_queue.get()) is not _DONE:
+                rec_id, info, chunks, embeddings = item
+                try:
+                    self.rag.index_chunks(info["file"], chunks, embeddings)
+                except Exception as e:
+                    log(f"INDEX ERROR {info['title'][:40]}: {e}")
+                    stats["embed_errors"] += 1
+                    continue
+                self._record_recording(rec_id, {**info, "embedded": True})
+                stats["embedded"] += 1
+                log(f"EMBEDDED: {info['title'][:40]} ({info['date'][:10]}, {len(chunks)} chunks)")
+        except Exception as e:
+            failures.append(e)
+            drain(upsert_queue)
+
+        for stage in stages:
+            stage.join()
+
+        if failures:
+            # Saved transcripts are journaled (and re-embedded next run); keep the old watermark
+            self._save_sync_state()
+            log(f"\n=== Sync+embed FAILED: {failures[0]} ===")
+            raise failures[0]
+
+        self._finish_sync(sync_started, unfinished)
+
+        rag_stats = self.rag.get_stats()
+        log(f"\n=== Sync+embed complete: {stats['new']} new, {skipped_count} skipped, "
+            f"{stats['errors']} download errors, {stats['embedded']} embedded, "
+            f"{stats['embed_errors']} embed errors, {rag_stats['total_chunks']} total chunks ===")
+        return {
+            "sync": {
+                "new": stats["new"],
+                "skipped": skipped_count,
+                "errors": stats["errors"],
+                "total": len(self.sync_state["synced_recordings"]),
+            },
+            "embed": {
+                "embedded": stats["embedded"],
+                "errors": stats["embed_errors"],
+                "total_chunks": rag_stats["total_chunks"],
+            },
+        }
+
+    def ingest_meeting(self, meeting: dict) -> dict | None:
+        """
+        Fetch, save and index one meeting right away (e.g. from a webhook).
+        Uses the inline transcript when the payload carries one.
+
+        Returns:
+            The recording's sync info, or None if it has no transcript yet
+        """
+        transcript_entries = self._fetch_transcript(meeting)
+        if not transcript_entries:
+            return None
+        rec_id, info, text = self._save_transcript(meeting, transcript_entries)
+        self.rag.index_transcript(text, info["file"], verbose=False)
+        info = {**info, "embedded": True}
+        self._record_recording(rec_id, info)
+        return info
 
     def status(self) -> dict:
         """Get sync and embedding status."""
@@ -237,13 +554,17 @@ class FathomSync:
             for rec_id, info in self.sync_state["synced_recordings"].items()
         ]
 
-    def ask(self, question: str, limit: int = 5) -> str:
-        """Ask a question about the transcripts."""
-        return self.rag.ask(question, limit=limit)
+    def ask(self, question: str, limit: int = 5, **filters) -> str:
+        """Ask a question about the transcripts (filters: see TranscriptRAG.search)."""
+        return self.rag.ask(question, limit=limit, **filters)
 
-    def search(self, query: str, limit: int = 5) -> list[dict]:
-        """Search transcripts."""
-        return self.rag.search(query, limit=limit)
+    def ask_stream(self, question: str, limit: int = 5, **filters):
+        """Ask a question, yielding answer tokens as they arrive."""
+        return self.rag.ask_stream(question, limit=limit, **filters)
+
+    def search(self, query: str, limit: int = 5, **filters) -> list[dict]:
+        """Search transcripts (filters: see TranscriptRAG.search)."""
+        return self.rag.search(query, limit=limit, **filters)
 
 
 if __name__ == "__main__":
@@ -260,6 +581,8 @@ if __name__ == "__main__":
         print("  status      - Show sync/embed status")
         print("  list        - List all synced transcripts")
         print("  ask         - Interactive Q&A mode")
+        print("                [--from YYYY-MM-DD] [--to YYYY-MM-DD] [--meeting TITLE]")
+        print("                [--speaker NAME] [--recording ID]")
         print("  force-sync  - Re-fetch all transcripts")
         print("  force-embed - Re-embed all transcripts")
         sys.exit(1)
@@ -285,7 +608,18 @@ if __name__ == "__main__":
             status = "✓" if t["embedded"] else "○"
             print(f"{status} [{t['date'][:10]}] {t['title']}")
     elif cmd == "ask":
+        import argparse
+        parser = argparse.ArgumentParser(prog="fathom_sync.py ask")
+        parser.add_argument("--from", dest="date_from")
+        parser.add_argument("--to", dest="date_to")
+        parser.add_argument("--meeting")
+        parser.add_argument("--speaker", action="append")
+        parser.add_argument("--recording", dest="recording_id")
+        filters = {k: v for k, v in vars(parser.parse_args(sys.argv[2:])).items() if v}
+
         print("\nFathom Transcript Q&A")
+        if filters:
+            print(f"Filters: {filters}")
         print("Type 'quit' to exit\n")
         while True:
             try:
@@ -295,8 +629,10 @@ if __name__ == "__main__":
                 if not q:
                     continue
                 print("\nThinking...\n")
-                answer = sync.ask(q)
-                print(f"Assistant: {answer}\n")
+                print("Assistant: ", end="", flush=True)
+                for token in sync.ask_stream(q, **filters):
+                    print(token, end="", flush=True)
+                print("\n")
             except KeyboardInterrupt:
                 break
     elif cmd == "force-sync":
@@ -0,0 +1,191 @@
+"""
+Fathom webhook receiver: new recordings become searchable within minutes.
+
+Verifies each delivery's signature (FathomClient.verify_webhook_signature),
+acknowledges immediately and hands the meeting to a worker thread that saves
+the transcript and pushes it through chunk -> embed -> upsert. Redeliveries
+(same webhook-id) are ignored. The worker also runs FathomSync.sync_and_embed
+periodically to pick up missed deliveries and failed ingests: the receiver
+holds the local Qdrant store and sync state, so a separate sync-embed process
+can't run alongside it.
+
+Usage:
+    python fathom_data/fathom_webhook.py --register https://host/fathom   # once; prints the secret
+    python fathom_data/fathom_webhook.py --port 8788                       # long-running receiver
+    python fathom_data/fathom_webhook.py --reconcile-minutes 30            # sync-embed every 30 min
+
+Requires FATHOM_WEBHOOK_SECRET (from --register) in .env.
+"""
+
+import os
+import sys
+import json
+import time
+import queue
+import argparse
+import threading
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from dotenv import load_dotenv
+
+from fathom_client import FathomClient
+from fathom_sync import FathomSync, log
+
+load_dotenv()
+
+# Reject deliveries whose timestamp is further than this from now (replay protection)
+TIMESTAMP_TOLERANCE_SECONDS = 5 * 60
+
+# Remember this many recent webhook-ids to drop redeliveries
+SEEN_IDS_SIZE = 1000
+
+WEBHOOK_TRIGGERS = ["my_recordings", "my_shared_with_team_recordings", "shared_team_recordings"]
+
+
+class SeenIds:
+    """Bounded, thread-safe set of recently queued or processed webhook-ids."""
+
+    def __init__(self, max_size: int = SEEN_IDS_SIZE):
+        self.max_size = max_size
+        self.ids = OrderedDict()
+        self.lock = threading.Lock()
+
+    def add(self, webhook_id: str) -> bool:
+        """Record webhook_id; False if it was already seen."""
+        with self.lock:
+            if webhook_id in self.ids:
+                return False
+            self.ids[webhook_id] = True
+            while len(self.ids) > self.max_size:
+                self.ids.popitem(last=False)
+            return True
+
+    def discard(self, webhook_id: str):
+        """Forget webhook_id so a redelivery is processed again."""
+        with self.lock:
+            self.ids.pop(webhook_id, None)
+
+
+def reconcile(sync: FathomSync):
+    """Incremental sync-embed: retries failed ingests and meetings whose delivery was missed."""
+    log("Reconciling with sync-embed...")
+    try:
+        sync.sync_and_embed()
+    except Exception as e:
+        log(f"ERROR reconciling: {e}")
+
+
+def run_worker(sync: FathomSync, events: queue.Queue, seen: SeenIds, reconcile_seconds: float):
+    """
+    Ingest queued (webhook_id, meeting) events one at a time and reconcile every
+    reconcile_seconds (single writer to the index and sync state). A failed
+    ingest forgets its webhook-id, so Fathom's redelivery is not dropped.
+    """
+    last_reconcile = time.time()
+    while True:
+        try:
+            event = events.get(timeout=max(last_reconcile + reconcile_seconds - time.time(), 0))
+        except queue.Empty:
+            reconcile(sync)
+            last_reconcile = time.time()
+            continue
+        if event is None:
+            break
+        webhook_id, meeting = event
+        title = meeting.get("meeting_title") or meeting.get("title", "Untitled")
+        try:
+            info = sync.ingest_meeting(meeting)
+            if info:
+                log(f"INDEXED: {title[:40]} ({meeting.get('created_at', '')[:10]})")
+            else:
+                log(f"SKIP: {title[:40]} - no transcript yet")
+        except Exception as e:
+            seen.discard(webhook_id)
+            log(f"ERROR: {title[:40]}: {e}")
+
+
+def make_handler(events: queue.Queue, seen: SeenIds, secret: str):
+    class WebhookHandler(BaseHTTPRequestHandler):
+        def _reply(self, status: int):
+            self.send_response(status)
+            self.end_headers()
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            webhook_id = self.headers.get("webhook-id")
+            timestamp = self.headers.get("webhook-timestamp")
+            signature = self.headers.get("webhook-signature")
+
+            if not (webhook_id and timestamp and signature):
+                return self._reply(400)
+            if not timestamp.isdigit() or abs(time.time() - int(timestamp)) > TIMESTAMP_TOLERANCE_SECONDS:
+                return self._reply(401)
+            if not FathomClient.verify_webhook_signature(body, webhook_id, timestamp, signature, secret):
+                return self._reply(401)
+
+            try:
+                meeting = json.loads(body)
+            except ValueError:
+                return self._reply(400)
+
+            # Marked on enqueue so in-flight redeliveries are dropped; the worker unmarks failures
+            if "recording_id" in meeting and seen.add(webhook_id):
+                events.put((webhook_id, meeting))
+            self._reply(200)
+
+        def log_message(self, format, *args):
+            pass  # Quiet; ingestion is logged by the worker
+
+    return WebhookHandler
+
+
+def register_webhook(url: str):
+    """Create a Fathom webhook (with inline transcripts) pointing at url."""
+    webhook = FathomClient().create_webhook(
+        destination_url=url,
+        triggered_for=WEBHOOK_TRIGGERS,
+        include_transcript=True,
+    )
+    print(f"Webhook created: {webhook.get('id')}")
+    print(f"Set FATHOM_WEBHOOK_SECRET={webhook.get('secret')} in .env")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fathom webhook receiver for the transcript RAG")
+    parser.add_argument("--port", type=int, default=8788, help="Port to listen on (default: 8788)")
+    parser.add_argument("--reconcile-minutes", type=float, default=60,
+                        help="Incremental sync-embed interval (default: 60)")
+    parser.add_argument("--register", metavar="URL", help="Register the webhook in Fathom and exit")
+    args = parser.parse_args()
+
+    if args.register:
+        register_webhook(args.register)
+        return
+
+    secret = os.getenv("FATHOM_WEBHOOK_SECRET")
+    if not secret:
+        print("ERROR: FATHOM_WEBHOOK_SECRET is not set (run with --register first)")
+        sys.exit(1)
+
+    sync = FathomSync()
+    events = queue.Queue()
+    seen = SeenIds()
+    worker = threading.Thread(target=run_worker, args=(sync, events, seen, args.reconcile_minutes * 60), daemon=True)
+    worker.start()
+
+    server = ThreadingHTTPServer(("", args.port), make_handler(events, seen, secret))
+    log(f"Listening on :{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        events.put(None)
+        worker.join()
+        log("Stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""
+Local BM25 index of transcript chunks (SQLite FTS5).
+
+Kept in step with the Qdrant collection (same point IDs and payloads), so
+exact names, domains and numbers can be found without an embedding call and
+lexical hits can be fused with vector hits (reciprocal rank fusion).
+
+Usage:
+    from lexical_index import LexicalIndex, rrf_fuse
+
+    index = LexicalIndex("transcripts")
+    index.add([(point_id, payload), ...])
+    hits = index.search("getlinks.pro invoice", limit=20)   # [(point_id, bm25, payload)]
+"""
+
+import os
+import re
+import json
+import sqlite3
+from pathlib import Path
+
+INDEX_PATH = os.getenv(
+    "LEXICAL_INDEX_PATH",
+    str(Path(__file__).parent / "fathom_data" / "lexical_index.sqlite")
+)
+
+# Reciprocal rank fusion constant (standard value from the RRF paper)
+RRF_K = 60
+
+# Queries with at most this many terms (and no question mark) are treated as keyword lookups
+KEYWORD_MAX_TERMS = 3
+
+# Terms: words, optionally joined by . @ - (domains, emails, order numbers)
+TERM_RE = re.compile(r"\w+(?:[.@-]\w+)*")
+
+
+def query_terms(query: str) -> list[str]:
+    return TERM_RE.findall(query)
+
+
+def is_keyword_query(query: str) -> bool:
+    """True for short lookups (names, domains, numbers) that BM25 answers well on its own."""
+    if '"' in query:
+        return True
+    terms = query_terms(query)
+    return 0 < len(terms) <= KEYWORD_MAX_TERMS and "?" not in query
+
+
+def to_match_expression(query: str) -> str:
+    """FTS5 MATCH expression: each term as a quoted phrase, OR-ed together."""
+    return " OR ".join('"{}"'.format(term.replace('"', '""')) for term in query_terms(query))
+
+
+def rrf_fuse(*rankings: list, k: int = RRF_K) -> list[tuple]:
+    """Fuse ranked lists of IDs; returns [(id, score)] best first."""
+    scores = {}
+    for ranking in rankings:
+        for rank, item_id in enumerate(ranking, 1):
+            scores[item_id] = scores.get(item_id, 0.0) + 1.0 / (k + rank)
+    return sorted(scores.items(), key=lambda kv: kv[1], reverse=True)
+
+
+class LexicalIndex:
+    """SQLite FTS5 table of chunk text with BM25 ranking, one table per collection."""
+
+    def __init__(self, collection: str, path: str = None):
+        self.path = path or INDEX_PATH
+        self.table = f"fts_{collection}"
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute(f"""
+                CREATE VIRTUAL TABLE IF NOT EXISTS {self.table} USING fts5(
+                    text,
+                    point_id UNINDEXED,
+                    source_file UNINDEXED,
+                    payload UNINDEXED,
+                    tokenize = 'unicode61 remove_diacritics 2'
+                )
+            """)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    def add(self, points: list[tuple]):
+        """Insert (point_id, payload) pairs; payload must contain text and source_file."""
+        rows = [
+            (payload["text"], str(pid), payload.get("source_file"), json.dumps(payload, ensure_ascii=False))
+            for pid, payload in points
+        ]
+        conn = self._connect()
+        try:
+            conn.executemany(
+                f"DELETE FROM {self.table} WHERE point_id = ?", [(row[1],) for row in rows]
+            )
+            conn.executemany(f"INSERT INTO {self.table} VALUES (?, ?, ?, ?)", rows)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def delete_source(self, source_file: str):
+        """Remove all chunks from source_file."""
+        conn = self._connect()
+        try:
+            conn.execute(f"DELETE FROM {self.table} WHERE source_file = ?", [str(source_file)])
+            conn.commit()
+        finally:
+            conn.close()
+
+    def search(self, query: str, limit: int = 20, filters: dict = None) -> list[tuple]:
+        """
+        Return [(point_id, score, payload)] by BM25, best first (higher score = better).
+
+        filters (all optional): date_gte / date_lt / date_lte (ISO strings), and lists of
+        accepted values for meeting, speakers and recording_id.
+        """
+        expression = to_match_expression(query)
+        if not expression:
+            return []
+
+        conditions, params = [f"{self.table} MATCH ?"], [expression]
+        filters = filters or {}
+        if filters.get("date_gte"):
+            conditions.append("json_extract(payload, '$.date') >= ?")
+            params.append(filters["date_gte"])
+        if filters.get("date_lt"):
+            conditions.append("json_extract(payload, '$.date') < ?")
+            params.append(filters["date_lt"])
+        if filters.get("date_lte"):
+            conditions.append("json_extract(payload, '$.date') <= ?")
+            params.append(filters["date_lte"])
+        for field in ("meeting", "recording_id"):
+            if filters.get(field):
+                conditions.append(f"json_extract(payload, '$.{field}') IN ({', '.join('?' * len(filters[field]))})")
+                params.extend(filters[field])
+        if filters.get("speakers"):
+            conditions.append(
+                "EXISTS (SELECT 1 FROM json_each(payload, '$.speakers') "
+                f"WHERE value IN ({', '.join('?' * len(filters['speakers']))}))"
+            )
+            params.extend(filters["speakers"])
+
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                f"SELECT point_id, bm25({self.table}), payload FROM {self.table} "
+                f"WHERE {' AND '.join(conditions)} ORDER BY bm25({self.table}) LIMIT ?",
+                [*params, limit]
+            ).fetchall()
+        finally:
+            conn.close()
+        # FTS5's bm25() is negative (lower = better); flip it for display
+        return [(pid, -score, json.loads(payload)) for pid, score, payload in rows]
+
+    def count(self) -> int:
+        conn = self._connect()
+        try:
+            return conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+        finally:
+            conn.close()
+
+    def clear(self):
+        """Remove all chunks."""
+        conn = self._connect()
+        try:
+            conn.execute(f"DELETE FROM {self.table}")
+            conn.commit()
+        finally:
+            conn.close()
@@ -0,0 +1,114 @@
+"""
+In-process caches for interactive Q&A.
+
+- QueryEmbeddingCache: LRU of question text -> embedding, so repeated
+  questions don't re-embed.
+- AnswerCache: semantic answer cache. An answer is reused when the retrieved
+  chunk IDs and chat model are identical and the new question is the same text
+  or its embedding is within ANSWER_SIMILARITY of the cached one. Entries
+  expire after ANSWER_TTL_SECONDS; the oldest are evicted beyond
+  ANSWER_CACHE_SIZE. TranscriptRAG clears it whenever the index changes.
+
+Usage:
+    from query_cache import QueryEmbeddingCache, AnswerCache
+
+    answers = AnswerCache()
+    answer = answers.get(model, chunk_ids, question, embedding)
+    if answer is None:
+        answer = generate()
+        answers.set(model, chunk_ids, question, embedding, answer)
+"""
+
+import os
+import math
+import time
+import threading
+from collections import OrderedDict
+
+QUERY_EMBEDDING_CACHE_SIZE = 1024
+ANSWER_CACHE_SIZE = 256
+ANSWER_TTL_SECONDS = int(os.getenv("ANSWER_CACHE_TTL", str(6 * 3600)))
+ANSWER_SIMILARITY = 0.95
+
+
+def normalize_question(text: str) -> str:
+    return " ".join(text.casefold().split())
+
+
+def cosine(a: list[float], b: list[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+class QueryEmbeddingCache:
+    """Thread-safe LRU of normalized question -> embedding."""
+
+    def __init__(self, max_size: int = QUERY_EMBEDDING_CACHE_SIZE):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, text: str):
+        key = normalize_question(text)
+        with self.lock:
+            if key not in self.entries:
+                return None
+            self.entries.move_to_end(key)
+            return self.entries[key]
+
+    def set(self, text: str, embedding: list[float]):
+        key = normalize_question(text)
+        with self.lock:
+            self.entries[key] = embedding
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+
+class AnswerCache:
+    """Answers keyed by (model, retrieved chunk IDs), matched by question similarity."""
+
+    def __init__(self, max_size: int = ANSWER_CACHE_SIZE, ttl: int = ANSWER_TTL_SECONDS,
+                 similarity: float = ANSWER_SIMILARITY):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.similarity = similarity
+        self.entries = OrderedDict()  # (model, chunk_ids, question) -> (embedding, answer, created)
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, model: str, chunk_ids: list[str], question: str, embedding: list[float] = None):
+        """Return a cached answer for a matching question, or None."""
+        ids = tuple(sorted(chunk_ids))
+        question = normalize_question(question)
+        now = time.time()
+        with self.lock:
+            for key, (cached_embedding, answer, created) in list(self.entries.items()):
+                if now - created > self.ttl:
+                    del self.entries[key]
+                    continue
+                if key[:2] != (model, ids):
+                    continue
+                if key[2] == question or (
+                    embedding is not None and cached_embedding is not None
+                    and cosine(embedding, cached_embedding) >= self.similarity
+                ):
+                    self.entries.move_to_end(key)
+                    self.hits += 1
+                    return answer
+            self.misses += 1
+            return None
+
+    def set(self, model: str, chunk_ids: list[str], question: str, embedding: list[float], answer: str):
+        key = (model, tuple(sorted(chunk_ids)), normalize_question(question))
+        with self.lock:
+            self.entries[key] = (embedding, answer, time.time())
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
@@ -1,205 +1,502 @@
 import os
 import re
+import uuid
+import hashlib
+from datetime import date, timedelta
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterator
 from dotenv import load_dotenv
 from openai import OpenAI
 from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, VectorParams, PointStruct
+from qdrant_client.models import (
+    Distance, VectorParams, PointStruct, Filter, FieldCondition, MatchValue, FilterSelector,
+    PayloadSchemaType, MatchAny, DatetimeRange, HnswConfigDiff, SearchParams,
+    ScalarQuantization, ScalarQuantizationConfig, ScalarType,
+)
+
+try:
+    from .embedding_cache import EmbeddingCache
+    from .embedding_backends import EmbeddingBackend, OPENAI_EMBEDDING_MODEL, get_backend, estimate_tokens
+    from .lexical_index import LexicalIndex, is_keyword_query, rrf_fuse
+    from .query_cache import QueryEmbeddingCache, AnswerCache
+except ImportError:
+    from embedding_cache import EmbeddingCache
+    from embedding_backends import EmbeddingBackend, OPENAI_EMBEDDING_MODEL, get_backend, estimate_tokens
+    from lexical_index import LexicalIndex, is_keyword_query, rrf_fuse
+    from query_cache import QueryEmbeddingCache, AnswerCache
 
 load_dotenv()
 
 QDRANT_PATH = "./qdrant_data"
+# Qdrant server (e.g. http://localhost:6333); without it the embedded store at QDRANT_PATH is used
+QDRANT_URL = os.getenv("QDRANT_URL")
+QDRANT_API_KEY = os.getenv("QDRANT_API_KEY")
 COLLECTION_NAME = "transcripts"
-EMBEDDING_MODEL = "text-embedding-3-small"
-EMBEDDING_DIM = 1536
 CHAT_MODEL = "gpt-4o-mini"
 
+# Points per upsert request
+UPSERT_BATCH_SIZE = 256
+
+# Chunking: token budget per chunk and overlap between consecutive chunks
+CHUNK_TOKENS = 400
+CHUNK_OVERLAP_TOKENS = 60
+
+# "[00:01:23] Speaker Name: text"
+TURN_RE = re.compile(r"^\[(\d{1,2}:\d{2}(?::\d{2})?)\]\s*([^:]+):")
+
+# Payload fields indexed for filtering (server mode; the embedded store scans all points)
+PAYLOAD_INDEXES = {
+    "source_file": PayloadSchemaType.KEYWORD,
+    "recording_id": PayloadSchemaType.KEYWORD,
+    "meeting": PayloadSchemaType.KEYWORD,
+    "speakers": PayloadSchemaType.KEYWORD,
+    "date": PayloadSchemaType.DATETIME,
+    "start_seconds": PayloadSchemaType.INTEGER,
+}
+
+# Hybrid search: candidates fetched from each retriever per requested result
+CANDIDATE_FACTOR = 4
+
+# Optional vector index tuning, server mode only (applied when a collection is created);
+# the embedded store always searches by brute force
+HNSW_M = os.getenv("QDRANT_HNSW_M")                      # graph degree, Qdrant default 16
+HNSW_EF_CONSTRUCT = os.getenv("QDRANT_HNSW_EF_CONSTRUCT")  # build-time beam, default 100
+HNSW_EF = os.getenv("QDRANT_HNSW_EF")                    # search-time beam
+QUANTIZATION = os.getenv("QDRANT_QUANTIZATION")          # "int8" = scalar quantization in RAM
+
+
+def collection_for(backend: EmbeddingBackend) -> str:
+    """Qdrant collection for a backend; vectors of different models/dims never mix."""
+    if backend.name == "openai" and backend.model == OPENAI_EMBEDDING_MODEL:
+        return COLLECTION_NAME  # original collection
+    slug = re.sub(r"[^a-z0-9]+", "_", backend.model.split("/")[-1].lower()).strip("_")
+    return f"{COLLECTION_NAME}_{backend.name}_{slug}"
+
+
+def build_filters(date_from: str = None, date_to: str = None, meeting=None,
+                  speaker=None, recording_id=None) -> dict:
+    """
+    Normalize search filters. Dates are ISO (YYYY-MM-DD or full timestamps), both
+    inclusive; meeting/speaker/recording_id take one value or a list of values.
+    """
+    def as_list(value):
+        if value is None:
+            return None
+        return [str(v) for v in value] if isinstance(value, (list, tuple, set)) else [str(value)]
+
+    date_lt = None
+    if date_to:
+        # A date-only upper bound includes the whole day
+        date_lt = (date.fromisoformat(date_to) + timedelta(days=1)).isoformat() if len(date_to) == 10 else None
+    filters = {
+        "date_gte": date_from,
+        "date_lt": date_lt,
+        "date_lte": date_to if date_to and not date_lt else None,
+        "meeting": as_list(meeting),
+        "speakers": as_list(speaker),
+        "recording_id": as_list(recording_id),
+    }
+    return {k: v for k, v in filters.items() if v}
+
+
+def qdrant_filter(filters: dict):
+    """Qdrant Filter for normalized filters (None if empty)."""
+    conditions = []
+    if any(k in filters for k in ("date_gte", "date_lt", "date_lte")):
+        conditions.append(FieldCondition(key="date", range=DatetimeRange(
+            gte=filters.get("date_gte"), lt=filters.get("date_lt"), lte=filters.get("date_lte"),
+        )))
+    for field in ("meeting", "speakers", "recording_id"):
+        if field in filters:
+            conditions.append(FieldCondition(key=field, match=MatchAny(any=filters[field])))
+    return Filter(must=conditions) if conditions else None
+
+
+def to_seconds(timestamp: str) -> int:
+    """'HH:MM:SS' or 'MM:SS' -> seconds."""
+    seconds = 0
+    for part in timestamp.split(":"):
+        seconds = seconds * 60 + int(part)
+    return seconds
+
+
+def split_turn(line: str, max_tokens: int) -> list[str]:
+    """Split a turn longer than max_tokens into word-boundary pieces."""
+    if estimate_tokens(line) <= max_tokens:
+        return [line]
+    pieces, words = [], []
+    for word in line.split():
+        if words and estimate_tokens(" ".join(words + [word])) > max_tokens:
+            pieces.append(" ".join(words))
+            words = []
+        words.append(word)
+    if words:
+        pieces.append(" ".join(words))
+    return pieces
+
+
+def point_id(source_file: str, index: int, text: str) -> str:
+    """Deterministic point ID: UUIDv5 of source file, chunk index and content hash."""
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"{source_file}#{index}#{digest}"))
+
 
 class TranscriptRAG:
-    def __init__(self):
-        self.openai = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        self.qdrant = QdrantClient(path=QDRANT_PATH)
+    def __init__(self, backend: EmbeddingBackend | str = None):
+        self._openai = None
+        self.backend = backend if isinstance(backend, EmbeddingBackend) else get_backend(backend)
+        self.collection = collection_for(self.backend)
+        self.server = bool(QDRANT_URL)
+        if self.server:
+            self.qdrant = QdrantClient(url=QDRANT_URL, api_key=QDRANT_API_KEY)
+        else:
+            self.qdrant = QdrantClient(path=QDRANT_PATH)
+        self.embedding_cache = EmbeddingCache()
+        self.lexical = LexicalIndex(self.collection)
+        self.query_embeddings = QueryEmbeddingCache()
+        self.answers = AnswerCache()
+        # Background work for search (query embedding overlapping BM25 retrieval)
+        self._executor = ThreadPoolExecutor(max_workers=2)
         self._ensure_collection()
+        self._sync_lexical_index()
+
+    @property
+    def openai(self) -> OpenAI:
+        """Chat client, created on first use (indexing with a local backend needs no API key)."""
+        if self._openai is None:
+            self._openai = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        return self._openai
 
     def _ensure_collection(self):
-        """Create collection if it doesn't exist."""
+        """Create collection if it doesn't exist, sized for the backend's vectors."""
         collections = [c.name for c in self.qdrant.get_collections().collections]
-        if COLLECTION_NAME not in collections:
+        if self.collection not in collections:
+            hnsw = {k: int(v) for k, v in (("m", HNSW_M), ("ef_construct", HNSW_EF_CONSTRUCT)) if v}
             self.qdrant.create_collection(
-                collection_name=COLLECTION_NAME,
-                vectors_config=VectorParams(size=EMBEDDING_DIM, distance=Distance.COSINE),
+                collection_name=self.collection,
+                vectors_config=VectorParams(size=self.backend.dim, distance=Distance.COSINE),
+                hnsw_config=HnswConfigDiff(**hnsw) if hnsw and self.server else None,
+                quantization_config=ScalarQuantization(
+                    scalar=ScalarQuantizationConfig(type=ScalarType.INT8, quantile=0.99, always_ram=True)
+                ) if QUANTIZATION == "int8" and self.server else None,
+            )
+            print(f"Created collection: {self.collection}")
+
+        info = self.qdrant.get_collection(self.collection)
+        size = info.config.params.vectors.size
+        if size != self.backend.dim:
+            raise ValueError(
+                f"Collection {self.collection} has {size}-dim vectors, "
+                f"backend {self.backend.name} ({self.backend.model}) produces {self.backend.dim}"
             )
-            print(f"Created collection: {COLLECTION_NAME}")
 
-    def _get_embedding(self, text: str) -> list[float]:
-        """Get embedding for text."""
-        response = self.openai.embeddings.create(input=text, model=EMBEDDING_MODEL)
-        return response.data[0].embedding
+        if not self.server:
+            return  # payload indexes have no effect in the embedded store
+        for field, schema in PAYLOAD_INDEXES.items():
+            if field not in (info.payload_schema or {}):
+                self.qdrant.create_payload_index(
+                    collection_name=self.collection, field_name=field, field_schema=schema
+                )
+
+    def _sync_lexical_index(self):
+        """Rebuild the BM25 index from Qdrant payloads if it is out of step."""
+        points_count = self.qdrant.get_collection(self.collection).points_count
+        if self.lexical.count() == points_count:
+            return
+        self.lexical.clear()
+        self.answers.clear()
+        offset = None
+        while True:
+            points, offset = self.qdrant.scroll(
+                collection_name=self.collection, limit=1000, offset=offset,
+                with_payload=True, with_vectors=False,
+            )
+            self.lexical.add([(p.id, p.payload) for p in points])
+            if offset is None:
+                break
 
-    def _chunk_transcript(self, text: str, chunk_size: int = 15) -> list[dict]:
+    def _get_embedding(self, text: str) -> list[float]:
+        """Get embedding for a query (in-process LRU, then the persistent cache, then the backend)."""
+        embedding = self.query_embeddings.get(text)
+        if embedding is None:
+            embedding = self.embed_texts([text])[0]
+            self.query_embeddings.set(text, embedding)
+        return embedding
+
+    def embed_texts(self, texts: list[str], verbose: bool = False) -> list[list[float]]:
         """
-        Split transcript into chunks by conversation turns.
-        Each chunk contains ~chunk_size turns with metadata.
+        Embed many texts. Cached vectors are reused; the rest are embedded in
+        backend batches (up to backend.concurrency in flight) and then cached.
+        """
+        embeddings = self.embedding_cache.get_many(self.backend.model, texts)
+        missing = list(dict.fromkeys(t for t, e in zip(texts, embeddings) if e is None))
+        if verbose:
+            cached = sum(e is not None for e in embeddings)
+            print(f"         {cached} cached, {len(missing)} to embed", flush=True)
+        if not missing:
+            return embeddings
+
+        batches = self.backend.batches(missing)
+        computed = {}
+        with ThreadPoolExecutor(max_workers=self.backend.concurrency) as pool:
+            for i, (batch, vectors) in enumerate(zip(batches, pool.map(self.backend.embed_batch, batches)), 1):
+                self.embedding_cache.set_many(self.backend.model, batch, vectors)
+                computed.update(zip(batch, vectors))
+                if verbose:
+                    print(f"         Batch {i}/{len(batches)} ({len(computed)}/{len(missing)} chunks)", flush=True)
+
+        return [e if e is not None else computed[t] for t, e in zip(texts, embeddings)]
+
+    def chunk_transcript(self, text: str, max_tokens: int = CHUNK_TOKENS,
+                          overlap_tokens: int = CHUNK_OVERLAP_TOKENS) -> list[dict]:
+        """
+        Split transcript into chunks of up to max_tokens (estimated) of
+        conversation turns, overlap included. Consecutive chunks of a meeting
+        share up to the last ~overlap_tokens of turns; chunks never span meetings.
+        Each chunk carries meeting, date, recording_id, speakers and start/end times.
         """
         chunks = []
-        current_meeting = None
-        current_date = None
-        lines = text.strip().split("\n")
-
-        buffer = []
-        for line in lines:
-            # Detect meeting header
-            if line.startswith("=" * 10):
-                continue
+        meeting = {"meeting": None, "date": None, "recording_id": None}
+        buffer = []  # (timestamp, speaker, line, tokens)
+
+        def flush(keep_overlap, incoming=0):
+            nonlocal buffer
+            if not buffer:
+                return
+            chunks.append({
+                "text": "\n".join(turn[2] for turn in buffer),
+                **meeting,
+                "speakers": sorted({turn[1] for turn in buffer}),
+                "start_time": buffer[0][0],
+                "end_time": buffer[-1][0],
+                "start_seconds": to_seconds(buffer[0][0]),
+                "end_seconds": to_seconds(buffer[-1][0]),
+            })
+            overlap, tokens = [], 0
+            # Carried turns count toward the next chunk; leave room for the incoming turn
+            budget = min(overlap_tokens, max_tokens - incoming)
+            if keep_overlap:
+                for turn in reversed(buffer[1:]):  # always advance by at least one turn
+                    if tokens + turn[3] > budget:
+                        break
+                    overlap.insert(0, turn)
+                    tokens += turn[3]
+            buffer = overlap
+
+        for line in text.split("\n"):
+            # Meeting header
             if line.startswith("MEETING:"):
-                current_meeting = line.replace("MEETING:", "").strip()
+                flush(keep_overlap=False)
+                meeting = {"meeting": line[len("MEETING:"):].strip(), "date": None, "recording_id": None}
                 continue
             if line.startswith("DATE:"):
-                current_date = line.replace("DATE:", "").strip()
+                meeting["date"] = line[len("DATE:"):].strip()
                 continue
-
-            # Skip empty lines
-            if not line.strip():
-                if buffer:
-                    chunks.append({
-                        "text": "\n".join(buffer),
-                        "meeting": current_meeting,
-                        "date": current_date,
-                    })
-                    buffer = []
+            if line.startswith("RECORDING_ID:"):
+                meeting["recording_id"] = line[len("RECORDING_ID:"):].strip() or None
                 continue
 
-            # Add transcript line to buffer
-            if line.startswith("["):
-                buffer.append(line)
-                if len(buffer) >= chunk_size:
-                    chunks.append({
-                        "text": "\n".join(buffer),
-                        "meeting": current_meeting,
-                        "date": current_date,
-                    })
-                    buffer = []
-
-        # Don't forget the last buffer
-        if buffer:
-            chunks.append({
-                "text": "\n".join(buffer),
-                "meeting": current_meeting,
-                "date": current_date,
-            })
+            match = TURN_RE.match(line)
+            if not match:
+                continue  # separators, blank lines, other headers
+            timestamp, speaker = match.group(1), match.group(2).strip()
+
+            for piece in split_turn(line, max_tokens):
+                tokens = estimate_tokens(piece)
+                if buffer and sum(turn[3] for turn in buffer) + tokens > max_tokens:
+                    flush(keep_overlap=True, incoming=tokens)
+                buffer.append((timestamp, speaker, piece, tokens))
 
+        flush(keep_overlap=False)
         return chunks
 
     def index_transcript_file(self, file_path: str, verbose: bool = True):
         """Index a transcript file into the vector store."""
         with open(file_path, "r") as f:
             content = f.read()
+        self.index_transcript(content, str(file_path), verbose=verbose)
 
-        chunks = self._chunk_transcript(content)
+    def index_transcript(self, content: str, source_file: str, verbose: bool = True):
+        """Index transcript text (already in memory) under source_file."""
+        chunks = self.chunk_transcript(content)
         total = len(chunks)
         if verbose:
             print(f"         {total} chunks to embed", flush=True)
 
-        # Check existing points count
-        collection_info = self.qdrant.get_collection(COLLECTION_NAME)
-        start_id = collection_info.points_count
-
-        points = []
-        for i, chunk in enumerate(chunks, 1):
-            if verbose and i % 5 == 0:
-                print(f"         Chunk {i}/{total}...", flush=True)
-            embedding = self._get_embedding(chunk["text"])
-            points.append(
-                PointStruct(
-                    id=start_id + i - 1,
-                    vector=embedding,
-                    payload={
-                        "text": chunk["text"],
-                        "meeting": chunk["meeting"],
-                        "date": chunk["date"],
-                        "source_file": str(file_path),
-                    },
-                )
-            )
-
-        self.qdrant.upsert(collection_name=COLLECTION_NAME, points=points)
+        embeddings = self.embed_texts([chunk["text"] for chunk in chunks], verbose=verbose)
+        self.index_chunks(source_file, chunks, embeddings)
         if verbose:
-            print(f"         Done: {len(points)} chunks indexed", flush=True)
-
-    def search(self, query: str, limit: int = 5) -> list[dict]:
-        """Search for relevant transcript chunks."""
-        query_embedding = self._get_embedding(query)
-        results = self.qdrant.query_points(
-            collection_name=COLLECTION_NAME,
-            query=query_embedding,
-            limit=limit,
-        ).points
-        return [
-            {
-                "text": r.payload["text"],
-                "meeting": r.payload["meeting"],
-                "date": r.payload["date"],
-                "score": r.score,
-            }
-            for r in results
+            print(f"         Done: {total} chunks indexed", flush=True)
+
+    def index_chunks(self, source_file: str, chunks: list[dict], embeddings: list[list[float]]):
+        """Replace source_file's points with already-embedded chunks."""
+        points = [
+            PointStruct(
+                id=point_id(source_file, i, chunk["text"]),
+                vector=embedding,
+                payload={**chunk, "source_file": source_file},
+            )
+            for i, (chunk, embedding) in enumerate(zip(chunks, embeddings))
         ]
 
-    def ask(self, question: str, limit: int = 5) -> str:
+        # Replace the file's previous points so re-indexing never duplicates
+        self.delete_source(source_file)
+        for i in range(0, len(points), UPSERT_BATCH_SIZE):
+            self.qdrant.upsert(collection_name=self.collection, points=points[i:i + UPSERT_BATCH_SIZE])
+        self.lexical.add([(p.id, p.payload) for p in points])
+        self.answers.clear()
+
+    def delete_source(self, source_file: str):
+        """Remove all points indexed from source_file."""
+        self.qdrant.delete(
+            collection_name=self.collection,
+            points_selector=FilterSelector(
+                filter=Filter(must=[FieldCondition(key="source_file", match=MatchValue(value=str(source_file)))])
+            ),
+        )
+        self.lexical.delete_source(source_file)
+        self.answers.clear()
+
+    def search(self, query: str, limit: int = 5, mode: str = "auto", **filters) -> list[dict]:
         """
-        Ask a question about the transcripts.
-        Uses RAG: retrieves relevant chunks, then asks LLM to answer.
+        Search for relevant transcript chunks.
+
+        Modes:
+            auto    - keyword-like queries with BM25 hits skip the embedding call, others use hybrid
+            hybrid  - BM25 and vector results fused with reciprocal rank fusion
+            vector  - dense similarity only
+            lexical - BM25 only
+
+        Filters (see build_filters): date_from, date_to, meeting, speaker, recording_id.
+        They are applied inside both retrievers (payload indexes / SQL), not after.
         """
-        # Retrieve relevant context
-        results = self.search(question, limit=limit)
+        filters = build_filters(**filters)
 
-        if not results:
-            return "No relevant transcripts found. Have you indexed any files?"
+        # Start the query embedding while BM25 runs, unless the lexical fast path is likely
+        embedding = None
+        if mode == "vector" or mode == "hybrid" or (mode == "auto" and not is_keyword_query(query)):
+            embedding = self._executor.submit(self._get_embedding, query)
+
+        lexical = [] if mode == "vector" else self.lexical.search(
+            query, limit=limit * CANDIDATE_FACTOR, filters=filters
+        )
+        if mode == "lexical" or (mode == "auto" and lexical and is_keyword_query(query)):
+            return [self._result(pid, payload, score) for pid, score, payload in lexical[:limit]]
+
+        vector = self.qdrant.query_points(
+            collection_name=self.collection,
+            query=embedding.result() if embedding else self._get_embedding(query),
+            query_filter=qdrant_filter(filters),
+            search_params=SearchParams(hnsw_ef=int(HNSW_EF)) if HNSW_EF and self.server else None,
+            limit=limit * CANDIDATE_FACTOR if lexical else limit,
+        ).points
+        if not lexical:
+            return [self._result(r.id, r.payload, r.score) for r in vector[:limit]]
 
-        # Build context
+        payloads = {pid: payload for pid, _, payload in lexical}
+        payloads.update((str(r.id), r.payload) for r in vector)
+        fused = rrf_fuse([str(r.id) for r in vector], [pid for pid, _, _ in lexical])
+        return [self._result(pid, payloads[pid], score) for pid, score in fused[:limit]]
+
+    @staticmethod
+    def _result(pid, payload: dict, score: float) -> dict:
+        return {
+            "id": str(pid),
+            "text": payload["text"],
+            "meeting": payload["meeting"],
+            "date": payload["date"],
+            "recording_id": payload.get("recording_id"),
+            "speakers": payload.get("speakers", []),
+            "start_time": payload.get("start_time"),
+            "end_time": payload.get("end_time"),
+            "score": score,
+        }
+
+    def _messages(self, question: str, results: list[dict]) -> list[dict]:
+        """Chat messages for answering question from retrieved chunks."""
         context_parts = []
         for r in results:
             context_parts.append(f"[{r['meeting']} - {r['date']}]\n{r['text']}")
         context = "\n\n---\n\n".join(context_parts)
 
-        # Ask LLM
-        response = self.openai.chat.completions.create(
-            model=CHAT_MODEL,
-            messages=[
-                {
-                    "role": "system",
-                    "content": """You are a helpful assistant analyzing meeting transcripts.
+        return [
+            {
+                "role": "system",
+                "content": """You are a helpful assistant analyzing meeting transcripts.
 Answer questions based on the provided transcript excerpts.
 The transcripts may be in Russian or Ukrainian - respond in the same language as the question.
 If you can't find the answer in the provided context, say so.
 Always cite which meeting/date the information comes from.""",
-                },
-                {
-                    "role": "user",
-                    "content": f"""Based on these transcript excerpts:
+            },
+            {
+                "role": "user",
+                "content": f"""Based on these transcript excerpts:
 
 {context}
 
 ---
 
 Question: {question}""",
-                },
-            ],
+            },
+        ]
+
+    def ask_stream(self, question: str, limit: int = 5, **filters) -> Iterator[str]:
+        """
+        Ask a question about the transcripts, yielding the answer as it is generated.
+        Uses RAG: retrieves relevant chunks (optionally filtered, see search),
+        then streams the LLM answer.
+        Answers are reused for similar questions over the same chunks.
+        """
+        # Retrieve relevant context
+        results = self.search(question, limit=limit, **filters)
+
+        if not results:
+            yield "No relevant transcripts found. Have you indexed any files?"
+            return
+
+        chunk_ids = [r["id"] for r in results]
+        embedding = self.query_embeddings.get(question)  # None if search took the lexical path
+        cached = self.answers.get(CHAT_MODEL, chunk_ids, question, embedding)
+        if cached is not None:
+            yield cached
+            return
+
+        stream = self.openai.chat.completions.create(
+            model=CHAT_MODEL,
+            messages=self._messages(question, results),
             temperature=0.3,
+            stream=True,
         )
+        parts = []
+        for chunk in stream:
+            token = chunk.choices[0].delta.content if chunk.choices else None
+            if token:
+                parts.append(token)
+                yield token
+
+        self.answers.set(CHAT_MODEL, chunk_ids, question, embedding, "".join(parts))
 
-        return response.choices[0].message.content
+    def ask(self, question: str, limit: int = 5, **filters) -> str:
+        """Ask a question about the transcripts and return the full answer."""
+        return "".join(self.ask_stream(question, limit=limit, **filters))
 
     def get_stats(self) -> dict:
         """Get collection statistics."""
-        info = self.qdrant.get_collection(COLLECTION_NAME)
+        info = self.qdrant.get_collection(self.collection)
         return {
             "total_chunks": info.points_count,
             "vector_size": info.config.params.vectors.size,
+            "backend": self.backend.name,
+            "embedding_model": self.backend.model,
+            "collection": self.collection,
         }
 
     def clear(self):
         """Clear all indexed data."""
-        self.qdrant.delete_collection(COLLECTION_NAME)
+        self.qdrant.delete_collection(self.collection)
+        self.lexical.clear()
+        self.answers.clear()
         self._ensure_collection()
         print("Cleared all indexed data")
 
@@ -233,8 +530,10 @@ if __name__ == "__main__":
                 continue
 
             print("\nSearching and thinking...\n")
-            answer = rag.ask(question)
-            print(f"Assistant: {answer}\n")
+            print("Assistant: ", end="", flush=True)
+            for token in rag.ask_stream(question):
+                print(token, end="", flush=True)
+            print("\n")
         except KeyboardInterrupt:
             break
 
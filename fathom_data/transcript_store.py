@@ -0,0 +1,298 @@
+"""
+Structured Fathom transcript store in the DuckDB warehouse.
+
+One row per meeting (fathom_meetings) and one row per conversation turn
+(fathom_transcript_turns), so transcripts can be searched and analysed with
+SQL and joined with the other warehouse tables: speaker/invitee emails with
+mongo_users.email, mentioned domains with clickup_orders.domain.
+
+FathomSync writes every downloaded transcript here (in addition to the text
+file used by the RAG index). Existing text files can be backfilled with
+`import`, and the tables can be exported to Parquet.
+
+Usage:
+    python fathom_data/transcript_store.py import            # Backfill from transcripts/*.txt and team_calls_transcripts.txt
+    python fathom_data/transcript_store.py talk-time         # Talk time per speaker
+    python fathom_data/transcript_store.py domains           # Mentioned domains, with ClickUp orders
+    python fathom_data/transcript_store.py search "invoice"  # Turns containing a term
+    python fathom_data/transcript_store.py export ./parquet  # Write both tables as Parquet
+"""
+
+import os
+import re
+import sys
+import hashlib
+import threading
+import importlib.util
+from datetime import datetime, timezone
+from pathlib import Path
+
+WAREHOUSE_PATH = os.getenv(
+    "WAREHOUSE_PATH",
+    str(Path(__file__).resolve().parent.parent / "warehouse.duckdb")
+)
+TRANSCRIPTS_DIR = Path(__file__).parent / "fathom_data" / "transcripts"
+ARCHIVE_FILE = Path(__file__).parent / "team_calls_transcripts.txt"
+
+TURN_LINE_RE = re.compile(r"^\[(\d{1,2}:\d{2}(?::\d{2})?)\]\s*([^:]+):\s?(.*)$")
+DOMAIN_PATTERN = r"[a-z0-9][-a-z0-9]*\.[a-z]{2,}(?:\.[a-z]{2,})?"
+
+
+def to_seconds(timestamp: str) -> int:
+    """'HH:MM:SS' or 'MM:SS' -> seconds."""
+    seconds = 0
+    for part in timestamp.split(":"):
+        seconds = seconds * 60 + int(part)
+    return seconds
+
+
+def to_timestamp(value: str):
+    """ISO 8601 (with Z or offset, or date only) -> naive UTC datetime."""
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def meeting_rows(meeting: dict, transcript_entries: list) -> tuple[tuple, list[tuple]]:
+    """Rows for a Fathom API meeting and its transcript entries."""
+    recording_id = str(meeting["recording_id"])
+    meeting_row = (
+        recording_id,
+        meeting.get("meeting_title") or meeting.get("title", "Untitled"),
+        to_timestamp(meeting.get("created_at")),
+        meeting.get("url"),
+        [i.get("email") for i in meeting.get("calendar_invitees", []) if i.get("email")],
+        datetime.now(),
+    )
+    turn_rows = [
+        (
+            recording_id,
+            index,
+            entry["timestamp"],
+            to_seconds(entry["timestamp"]),
+            entry["speaker"]["display_name"],
+            entry["speaker"].get("matched_calendar_invitee_email"),
+            entry["text"],
+        )
+        for index, entry in enumerate(transcript_entries)
+    ]
+    return meeting_row, turn_rows
+
+
+def synthetic_recording_id(source: str, title: str, date: str, occurrence: int) -> str:
+    """Stable ID for a meeting without RECORDING_ID (e.g. the team_calls_transcripts.txt archive)."""
+    key = f"{source}\0{title}\0{date}\0{occurrence}"
+    return "file-" + hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+
+
+def parse_transcript_file(text: str, source: str = "") -> list[tuple[tuple, list[tuple]]]:
+    """
+    Parse FathomSync's text layout back into rows. Meetings without a
+    RECORDING_ID line get a synthetic one from source (file name), title and date.
+    """
+    meetings = []
+    header, turns = None, []
+    seen = {}  # (title, date) -> meetings so far, keeps repeated title/date pairs apart
+
+    def flush():
+        if header:
+            recording_id = header.get("recording_id")
+            if not recording_id:
+                title_date = (header.get("title"), header.get("date"))
+                seen[title_date] = seen.get(title_date, 0) + 1
+                recording_id = synthetic_recording_id(source, *title_date, seen[title_date])
+            meeting = {
+                "recording_id": recording_id,
+                "title": header.get("title"),
+                "created_at": header.get("date"),
+                "url": header.get("url") or None,
+                "calendar_invitees": [{"email": e.strip()} for e in header.get("invitees", "").split(",") if e.strip()],
+            }
+            meetings.append(meeting_rows(meeting, turns))
+
+    for line in text.split("\n"):
+        for prefix, key in (("MEETING:", "title"), ("DATE:", "date"), ("RECORDING_ID:", "recording_id"),
+                            ("URL:", "url"), ("INVITEES:", "invitees")):
+            if line.startswith(prefix):
+                if key == "title":
+                    flush()
+                    header, turns = {}, []
+                header[key] = line[len(prefix):].strip()
+                break
+        else:
+            match = TURN_LINE_RE.match(line)
+            if match and header is not None:
+                turns.append({
+                    "timestamp": match.group(1),
+                    "speaker": {"display_name": match.group(2).strip()},
+                    "text": match.group(3),
+                })
+            elif turns and line.strip():
+                turns[-1]["text"] += "\n" + line  # multi-line turn
+    flush()
+    return meetings
+
+
+class TranscriptStore:
+    """Writes and queries transcript tables in the warehouse (short-lived connection per call)."""
+
+    def __init__(self, path: str = None):
+        if importlib.util.find_spec("duckdb") is None:
+            raise ImportError("The transcript store needs duckdb. Run:\n  pip3 install duckdb")
+        import duckdb
+
+        self.duckdb = duckdb
+        self.path = path or WAREHOUSE_PATH
+        self.lock = threading.Lock()
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS fathom_meetings (
+                    recording_id VARCHAR PRIMARY KEY,
+                    title VARCHAR,
+                    created_at TIMESTAMP,
+                    url VARCHAR,
+                    invitee_emails VARCHAR[],
+                    synced_at TIMESTAMP
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS fathom_transcript_turns (
+                    recording_id VARCHAR,
+                    turn_index INTEGER,
+                    timestamp VARCHAR,
+                    start_seconds INTEGER,
+                    speaker VARCHAR,
+                    speaker_email VARCHAR,
+                    text VARCHAR,
+                    PRIMARY KEY (recording_id, turn_index)
+                )
+            """)
+
+    def _connect(self, read_only: bool = False):
+        # The warehouse is shared with other syncs; don't hold it open between writes
+        return self.duckdb.connect(self.path, read_only=read_only)
+
+    def write(self, meeting_row: tuple, turn_rows: list[tuple]):
+        """Replace one meeting and its turns in a single transaction."""
+        with self.lock, self._connect() as conn:
+            conn.execute("BEGIN TRANSACTION")
+            try:
+                conn.execute("DELETE FROM fathom_transcript_turns WHERE recording_id = ?", [meeting_row[0]])
+                conn.execute("INSERT OR REPLACE INTO fathom_meetings VALUES (?, ?, ?, ?, ?, ?)", meeting_row)
+                if turn_rows:
+                    conn.executemany(
+                        "INSERT INTO fathom_transcript_turns VALUES (?, ?, ?, ?, ?, ?, ?)", turn_rows
+                    )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def write_meeting(self, meeting: dict, transcript_entries: list):
+        """Store a meeting from the Fathom API with its transcript entries."""
+        self.write(*meeting_rows(meeting, transcript_entries))
+
+    def import_files(self, paths) -> int:
+        """Backfill from FathomSync text files; returns meetings imported."""
+        count = 0
+        for path in paths:
+            for meeting_row, turn_rows in parse_transcript_file(Path(path).read_text(), Path(path).name):
+                self.write(meeting_row, turn_rows)
+                count += 1
+        return count
+
+    def query(self, sql: str, params: list = None):
+        with self._connect(read_only=True) as conn:
+            return conn.execute(sql, params or []).fetchall()
+
+    def talk_time(self) -> list[tuple]:
+        """(speaker, turns, talk seconds): a turn lasts until the next one starts."""
+        return self.query("""
+            SELECT speaker, COUNT(*) AS turns, SUM(next_start - start_seconds) AS talk_seconds
+            FROM (
+                SELECT speaker, start_seconds,
+                       LEAD(start_seconds) OVER (PARTITION BY recording_id ORDER BY turn_index) AS next_start
+                FROM fathom_transcript_turns
+            )
+            GROUP BY speaker
+            ORDER BY talk_seconds DESC NULLS LAST
+        """)
+
+    def domain_mentions(self, limit: int = 50) -> list[tuple]:
+        """(domain, mentions, meetings, clickup orders) for domains said in calls."""
+        tables = {row[0] for row in self.query("SHOW TABLES")}
+        orders = (
+            "(SELECT COUNT(*) FROM clickup_orders o WHERE lower(o.domain) = m.domain)"
+            if "clickup_orders" in tables else "NULL"
+        )
+        return self.query(f"""
+            WITH mentions AS (
+                SELECT recording_id, unnest(regexp_extract_all(lower(text), '{DOMAIN_PATTERN}')) AS domain
+                FROM fathom_transcript_turns
+            )
+            SELECT m.domain, COUNT(*) AS mentions, COUNT(DISTINCT m.recording_id) AS meetings,
+                   {orders} AS orders
+            FROM mentions m
+            GROUP BY m.domain
+            ORDER BY mentions DESC
+            LIMIT ?
+        """, [limit])
+
+    def search(self, term: str, limit: int = 20) -> list[tuple]:
+        """(created_at, title, timestamp, speaker, text) of turns containing term."""
+        return self.query("""
+            SELECT m.created_at, m.title, t.timestamp, t.speaker, t.text
+            FROM fathom_transcript_turns t
+            JOIN fathom_meetings m USING (recording_id)
+            WHERE t.text ILIKE '%' || ? || '%'
+            ORDER BY m.created_at DESC, t.turn_index
+            LIMIT ?
+        """, [term, limit])
+
+    def export_parquet(self, directory: str):
+        """Write fathom_meetings / fathom_transcript_turns as Parquet files."""
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        with self._connect(read_only=True) as conn:
+            for table in ("fathom_meetings", "fathom_transcript_turns"):
+                target = str(Path(directory) / f"{table}.parquet").replace("'", "''")
+                conn.execute(f"COPY {table} TO '{target}' (FORMAT PARQUET)")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python transcript_store.py <command>")
+        print("\nCommands:")
+        print("  import       - Backfill from synced transcript files and the archive")
+        print("  talk-time    - Talk time per speaker")
+        print("  domains      - Domains mentioned in calls (with ClickUp order counts)")
+        print("  search TERM  - Turns containing TERM")
+        print("  export DIR   - Export tables to Parquet")
+        sys.exit(1)
+
+    store = TranscriptStore()
+    cmd = sys.argv[1]
+
+    if cmd == "import":
+        paths = sorted(TRANSCRIPTS_DIR.glob("*.txt"))
+        if ARCHIVE_FILE.exists():
+            paths.append(ARCHIVE_FILE)
+        count = store.import_files(paths)
+        print(f"Imported {count} meetings")
+    elif cmd == "talk-time":
+        for speaker, turns, seconds in store.talk_time():
+            print(f"{speaker[:40]:<40} {turns:>6} turns  {(seconds or 0) / 60:>8.1f} min")
+    elif cmd == "domains":
+        for domain, mentions, meetings, orders in store.domain_mentions():
+            print(f"{domain:<40} {mentions:>5} mentions  {meetings:>4} meetings  {orders if orders is not None else '-':>5} orders")
+    elif cmd == "search" and len(sys.argv) > 2:
+        for created_at, title, timestamp, speaker, text in store.search(sys.argv[2]):
+            print(f"[{str(created_at)[:10]}] {title[:30]} [{timestamp}] {speaker}: {text}")
+    elif cmd == "export" and len(sys.argv) > 2:
+        store.export_parquet(sys.argv[2])
+        print(f"Exported to {sys.argv[2]}")
+    else:
+        print(f"Unknown command: {cmd}")
+        sys.exit(1)